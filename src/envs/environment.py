@@ -9,6 +9,12 @@ import json
 import matplotlib.pyplot as plt
 import numpy as np
 
+# orjson is an optional, faster drop-in for the serialization of obstacles
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from src.obstacles.point import Point
 from src.obstacles.line import Line
 from src.obstacles.polygon import Polygon
@@ -294,8 +300,12 @@ class Environment:
                     "Invalid obstacle type. Only Point, Line, or Polygon are supported."
                 )
 
-        with open(filepath, "w") as f:
-            json.dump(output, f)
+        if orjson is not None:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(output))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(output, f)
 
     def load(self, filepath: str):
         """
@@ -321,8 +331,11 @@ class Environment:
         obstacles = {}
 
         # load obstacles from file
-        with open(filepath, "r") as f:
-            obstacles = json.load(f)
+        with open(filepath, "rb") as f:
+            content = f.read()
+            obstacles = (
+                orjson.loads(content) if orjson is not None else json.loads(content)
+            )
 
         # convert obstacles to custom class objects and store them in class variable
         for pt_obj in obstacles["points"]:
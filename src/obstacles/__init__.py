@@ -2,3 +2,4 @@ from .geometry import Geometry
 from .point import Point
 from .line import Line
 from .polygon import Polygon
+from .index import ObstacleIndex
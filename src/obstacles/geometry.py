@@ -1,7 +1,162 @@
 from shapely.geometry import Point, LineString, Polygon
+from shapely import wkb, wkt
 from pandas import Interval
+from functools import lru_cache
 
 from src.util.recurrence import Recurrence
+from src.util.interval import Interval as Bounds
+
+# relative tolerance by which bounding boxes are enlarged before shapes are rejected based on them
+BBOX_TOLERANCE = 1e-9
+
+
+def bbox_tolerance(bounds: tuple, radius: float = 0):
+    """
+    Returns the absolute tolerance by which a bounding box has to be enlarged, such that rejections
+    based on it are conservative. The bounds and the differences to them are rounded, which could
+    otherwise reject shapes whose GEOS distance is exactly the radius.
+
+    Args:
+        bounds (tuple): The bounding box as (min_x, min_y, max_x, max_y).
+        radius (float, optional): The radius the bounding box is compared with.
+
+    Returns:
+        float: The tolerance, scaled with the magnitude of the bounds and the radius.
+    """
+    min_x, min_y, max_x, max_y = bounds
+    return BBOX_TOLERANCE * (1 + radius + max(-min_x, -min_y, max_x, max_y))
+
+
+def geometry_to_json(geometry):
+    """
+    Returns the JSON representation of a shapely geometry, which is shared by all obstacle types.
+    The geometry is stored as hex-encoded WKB, which is both more compact and faster to parse than WKT.
+
+    Args:
+        geometry: The shapely geometry, may be None.
+
+    Returns:
+        dict: The JSON representation of the geometry, empty if no geometry is given.
+    """
+    if geometry is None:
+        return {}
+
+    return {"wkb": geometry.wkb_hex}
+
+
+def geometry_from_json(json_object: dict):
+    """
+    Loads a shapely geometry from the JSON representation of an obstacle. Besides hex-encoded WKB,
+    representations containing the stringified (WKT) version of the geometry are supported as well.
+
+    Args:
+        json_object (dict): The JSON representation of the obstacle.
+
+    Returns:
+        The shapely geometry, or None if the representation does not contain a geometry.
+    """
+    if "wkb" in json_object:
+        return wkb.loads(json_object["wkb"], hex=True)
+    if json_object.get("geometry", "None") != "None":
+        return wkt.loads(json_object["geometry"])
+    return None
+
+
+def _is_active(
+    bounds: Bounds,
+    recurrence: Recurrence,
+    query_time: float = None,
+    query_interval: Interval = None,
+):
+    """
+    Checks if a time interval, given by its numeric bounds, and recurrence is active at a given
+    time or time interval.
+
+    Args:
+        bounds (Bounds): The bounds and closedness of the time interval.
+        recurrence (Recurrence): The recurrence frequency of the time interval.
+        query_time (optional): The specific time to check activity at.
+        query_interval (optional): The time interval to check activity within.
+
+    Returns:
+        bool: True if active, False otherwise.
+    """
+    # check if time interval overlaps with query time or interval in the case of no recurrence
+    if recurrence == Recurrence.NONE:
+        if query_time is not None:
+            return bounds.contains(query_time)
+        elif query_interval is not None:
+            return bounds.overlaps(query_interval)
+
+        # if neither query_time nor query_interval is given, consider the obstacle to be active
+        return True
+
+    return _is_active_recurring(bounds, recurrence, query_time, query_interval)
+
+
+@lru_cache(maxsize=4096)
+def _is_active_recurring(
+    bounds: Bounds,
+    recurrence: Recurrence,
+    query_time: float = None,
+    query_interval: Interval = None,
+):
+    """
+    Checks if a recurring time interval, given by its numeric bounds, is active at a given time or
+    time interval. Only these checks are memoized, as the non-recurring ones are cheaper than a
+    cache lookup.
+
+    Args:
+        bounds (Bounds): The bounds and closedness of the time interval.
+        recurrence (Recurrence): The recurrence frequency of the time interval, other than NONE.
+        query_time (optional): The specific time to check activity at.
+        query_interval (optional): The time interval to check activity within.
+
+    Returns:
+        bool: True if active, False otherwise.
+    """
+    # check if time interval overlaps with query time or interval in the case of recurrence
+    if query_time is not None:
+        # if query_time is before obstacle_start, return false
+        if query_time < bounds.left:
+            return False
+
+        # find the occurence of the obstacle, which includes the query_time
+        delta = query_time - bounds.left
+        recurrence_length = recurrence.get_seconds()
+        occurence = delta // recurrence_length
+        offset = occurence * recurrence_length
+
+        # check if query_time is in the time interval of the occurence
+        return bounds.shift(offset).contains(query_time)
+
+    else:
+        # if query_time is before obstacle_start, return false
+        if query_interval.right < bounds.left:
+            return False
+
+        # find the occurence covered by the query_interval
+        delta_start = query_interval.left - bounds.left
+        delta_end = query_interval.right - bounds.left
+        recurrence_length = recurrence.get_seconds()
+        start_k = delta_start // recurrence_length
+        end_k = delta_end // recurrence_length
+
+        # if the query interval spans over multiple occurence, at least one of the inner ones must be active
+        if end_k - start_k > 0:
+            return True
+        # if start and end are equal, check the corresponding occurence for activity
+        elif start_k == end_k:
+            offset = start_k * recurrence_length
+            return bounds.shift(offset).overlaps(query_interval)
+        # other cases should not occur, throw an error
+        else:
+            raise RuntimeError(
+                "There occurred an error while checking for activity with recurrence parameter. Computed start and end parameters: "
+                + str(start_k)
+                + ", "
+                + str(end_k)
+            )
 
 
 class Geometry:
@@ -19,11 +174,14 @@ class Geometry:
         set_radius(radius: float): Sets the radius around the point, considered to be in collision.
         set_recurrence(recurrence: Recurrence): Sets the recurrence frequency.
         is_active(query_time: float = None, query_interval: Interval = None): Checks if the geometry is active at a given time or time interval.
+        bbox(): Returns the axis-aligned bounding box of the geometry, including its radius.
         export_to_json(): Returns a JSON representation of the geometry.
         load_from_json(json_object: dict): Loads radius and time interval from a JSON object.
         interval_from_string(input_str: str): Creates a pandas interval from a string.
     """
 
+    __slots__ = ("radius", "_time_interval", "_bounds", "recurrence")
+
     def __init__(
         self,
         radius: float = None,
@@ -56,6 +214,19 @@ class Geometry:
         else:
             self.recurrence = recurrence
 
+    @property
+    def time_interval(self):
+        """
+        The time interval of the geometry, or None if the geometry is static.
+        """
+        return self._time_interval
+
+    @time_interval.setter
+    def time_interval(self, interval: Interval):
+        # keep the numeric bounds in sync, as they are used for the activity checks
+        self._time_interval = interval
+        self._bounds = Bounds.from_pandas(interval)
+
     def set_interval(self, lower_bound: float, upper_bound: float):
         """
         Sets the closed time interval from a lower and upper bound.
@@ -93,7 +264,8 @@ class Geometry:
 
         Args:
             query_time (optional): The specific time to check activity at.
-            query_interval (optional): The time interval to check activity within.
+            query_interval (optional): The time interval to check activity within. Besides intervals,
+                a plain (start, end) tuple is accepted and treated as a closed interval.
 
         Returns:
             bool: True if active, False otherwise. Objects without a time interval are always active.
@@ -103,66 +275,25 @@ class Geometry:
             return True
 
         # obstacles without time interval are considered to be static / active all the time
-        if self.time_interval is None:
+        if self._bounds is None:
             return True
-        else:
-            # check if time interval overlaps with query time or interval in the case of no recurrence
-            if self.recurrence == Recurrence.NONE:
-                if query_time is not None:
-                    return query_time in self.time_interval
-                elif query_interval is not None:
-                    return self.time_interval.overlaps(query_interval)
-
-                # if neither query_time nor query_interval is given, consider the obstacle to be active
-                return True
-
-            # check if time interval overlaps with query time or interval in the case of recurrence
-            if query_time is not None:
-                # if query_time is before obstacle_start, return false
-                if query_time < self.time_interval.left:
-                    return False
-
-                # find the occurence of the obstacle, which includes the query_time
-                delta = query_time - self.time_interval.left
-                recurrence_length = self.recurrence.get_seconds()
-                occurence = delta // recurrence_length
-
-                # check if query_time is in the time interval of the occurence
-                if query_time in self.time_interval + occurence * recurrence_length:
-                    return True
-                else:
-                    return False
-
-            else:
-                # if query_time is before obstacle_start, return false
-                if query_interval.right < self.time_interval.left:
-                    return False
-
-                # find the occurence covered by the query_interval
-                delta_start = query_interval.left - self.time_interval.left
-                delta_end = query_interval.right - self.time_interval.left
-                recurrence_length = self.recurrence.get_seconds()
-                start_k = delta_start // recurrence_length
-                end_k = delta_end // recurrence_length
-
-                # if the query interval spans over multiple occurence, at least one of the inner ones must be active
-                if end_k - start_k > 0:
-                    return True
-                # if start and end are equal, check the corresponding occurence for activity
-                elif start_k == end_k:
-                    return query_interval.overlaps(
-                        self.time_interval + start_k * recurrence_length
-                    )
-                # other cases should not occur, throw an error
-                else:
-                    raise RuntimeError(
-                        "There occurred an error while checking for activity with recurrence parameter. Computed start and end parameters: "
-                        + str(start_k)
-                        + ", "
-                        + str(end_k)
-                    )
-
-        raise RuntimeError("There occurred an error while checking for activity.")
+
+        # plain tuples carry no closedness, wrap them without going through pandas
+        if type(query_interval) is tuple:
+            query_interval = Bounds(*query_interval)
+
+        return _is_active(self._bounds, self.recurrence, query_time, query_interval)
+
+    def bbox(self):
+        """
+        Returns the axis-aligned bounding box of the geometry, including its radius.
+
+        Returns:
+            tuple: The bounding box as (min_x, min_y, max_x, max_y).
+        """
+        min_x, min_y, max_x, max_y = self.geometry.bounds
+        radius = self.radius if self.radius is not None else 0
+        return (min_x - radius, min_y - radius, max_x + radius, max_y + radius)
 
     def export_to_json(self):
         """
@@ -0,0 +1,79 @@
+from shapely import box
+from shapely.geometry import Point, LineString, Polygon
+from shapely.strtree import STRtree
+from pandas import Interval
+from typing import List, Union
+
+from .geometry import Geometry, bbox_tolerance
+
+
+class ObstacleIndex:
+    """
+    A spatial index over a set of obstacles, which prunes the candidates for collision checks
+    based on their bounding boxes before filtering them by their time intervals.
+
+    Attributes:
+        obstacles (list[Geometry]): The indexed obstacles.
+        tree (STRtree): The bulk-loaded R-tree over the bounding boxes of the obstacles.
+
+    Methods:
+        __init__(self, obstacles):
+            Initializes a new instance of the ObstacleIndex class.
+
+        query(self, shape, query_time=None, query_interval=None):
+            Returns the active obstacles, whose bounding boxes intersect the given shape.
+    """
+
+    def __init__(self, obstacles: List[Geometry]):
+        """
+        Initializes a new instance of the ObstacleIndex class.
+
+        Args:
+            obstacles (list[Geometry]): The obstacles to index.
+        """
+        self.obstacles = list(obstacles)
+        self.tree = STRtree([self._padded_box(obstacle) for obstacle in self.obstacles])
+
+    def _padded_box(self, obstacle: Geometry):
+        """
+        Returns the bounding box of an obstacle, enlarged by a small tolerance. The bounds including
+        the radius are rounded, so that shapes at a distance of exactly the radius could otherwise
+        lie just outside of the box and be pruned.
+
+        Args:
+            obstacle (Geometry): The obstacle to compute the box for.
+
+        Returns:
+            Polygon: The padded bounding box.
+        """
+        bounds = obstacle.bbox()
+        tolerance = bbox_tolerance(bounds)
+        min_x, min_y, max_x, max_y = bounds
+        return box(
+            min_x - tolerance, min_y - tolerance, max_x + tolerance, max_y + tolerance
+        )
+
+    def query(
+        self,
+        shape: Union[Point, LineString, Polygon],
+        query_time: float = None,
+        query_interval: Interval = None,
+    ):
+        """
+        Returns the active obstacles, whose bounding boxes intersect the given shape.
+        The returned obstacles are only candidates and still have to be checked with check_collision.
+
+        Args:
+            shape (Point, LineString, or Polygon): The shape to query the index with.
+            query_time (optional): The specific time to check activity at.
+            query_interval (optional): The time interval to check activity within.
+
+        Returns:
+            list[Geometry]: The candidate obstacles in the order they were indexed.
+        """
+        candidates = sorted(self.tree.query(shape))
+        return [
+            self.obstacles[idx]
+            for idx in candidates
+            if self.obstacles[idx].is_active(query_time, query_interval)
+        ]
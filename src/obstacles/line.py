@@ -1,12 +1,11 @@
 from shapely.geometry import Point, LineString, Polygon
-from shapely import wkt
 from pandas import Interval
 from matplotlib.patches import Circle
 from typing import Union
 import matplotlib.pyplot as plt
 import numpy as np
 
-from .geometry import Geometry
+from .geometry import Geometry, geometry_to_json, geometry_from_json
 from src.util.recurrence import Recurrence
 
 
@@ -113,22 +112,17 @@ class Line(Geometry):
         Raises:
             TypeError: If the shape type is not supported.
         """
-        if self.is_active(query_time, query_interval):
-            if isinstance(shape, Point):
-                distance = self.geometry.distance(shape)
-            elif isinstance(shape, LineString):
-                distance = self.geometry.distance(shape)
-            elif isinstance(shape, Polygon):
-                distance = self.geometry.distance(shape)
-            else:
-                raise TypeError(
-                    "Invalid shape type. Only LineString or Polygon are supported."
-                )
-
-            return distance <= self.radius
-        else:
+        # reject unsupported shapes up front, independently of the temporal query
+        if not isinstance(shape, (Point, LineString, Polygon)):
+            raise TypeError(
+                "Invalid shape type. Only LineString or Polygon are supported."
+            )
+
+        if not self.is_active(query_time, query_interval):
             return False
 
+        return self.geometry.distance(shape) <= self.radius
+
     def plot(
         self,
         query_time: float = None,
@@ -282,20 +276,18 @@ class Line(Geometry):
     def export_to_json(self):
         """
         Returns a JSON representation of the line object, using the corresponding exporting
-        function of the Geometry class and the stringified version of the geometry.
+        function of the Geometry class and the hex-encoded WKB representation of the geometry.
 
         Returns:
             str: A JSON representation of the line object.
         """
-        if self.geometry is None:
-            return {**super().export_to_json(), "geometry": "None"}
-
-        return {**super().export_to_json(), "geometry": self.geometry.wkt}
+        return {**super().export_to_json(), **geometry_to_json(self.geometry)}
 
     def load_from_json(self, json_object):
         """
         Loads the line object from a JSON representation, using the corresponding loading
-        function of the Geometry class and the stringified version of the geometry.
+        function of the Geometry class and the hex-encoded WKB representation of the geometry.
+        Representations containing the stringified version of the geometry are supported as well.
 
         Args:
             json_object (dict): The JSON representation of the line object.
@@ -304,8 +296,4 @@ class Line(Geometry):
             Object with updated attributes for both the geometry and the parent Geometry object
         """
         super().load_from_json(json_object)
-
-        if json_object["geometry"] == "None":
-            self.geometry = None
-        else:
-            self.geometry = wkt.loads(json_object["geometry"])
+        self.geometry = geometry_from_json(json_object)
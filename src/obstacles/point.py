@@ -1,12 +1,12 @@
 from shapely.geometry import Point as ShapelyPoint, LineString, Polygon
-from shapely import wkt
+from shapely import points as shapely_points
 from pandas import Interval
 from matplotlib.patches import Circle
 from typing import Union
 import matplotlib.pyplot as plt
 import numpy as np
 
-from .geometry import Geometry
+from .geometry import Geometry, geometry_to_json, geometry_from_json
 from src.util.recurrence import Recurrence
 
 
@@ -24,12 +24,21 @@ class Point(Geometry):
         __init__(self, geometry=None, time_interval=None, radius=0):
             Initializes a new instance of the Point class.
 
+        buffered(self):
+            Returns the circular area around the point, which is considered to be in collision.
+
         set_geometry(self, x, y):
             Sets the geometry from a coordinate pair.
 
+        bbox(self):
+            Returns the axis-aligned bounding box of the point, including its radius.
+
         check_collision(self, shape, query_time=None, query_interval=None):
             Checks if the point is in collision with a given shape. Touching time intervals are considered to be overlapping.
 
+        check_collision_batch(self, xs, ys, query_time=None, query_interval=None):
+            Checks a batch of coordinate pairs for collision with the point in a single vectorized pass.
+
         plot(self, query_time=None, query_interval=None, color="black", fill_color=None, opacity=1, show_inactive=False, inactive_color="grey", inactive_fill_color=None, fig=None):
             Plots the point with a circle of the corresponding radius around it.
             Optionally, only shows the point with the circle if it is active.
@@ -57,8 +66,26 @@ class Point(Geometry):
             random_recurrence=False,
         ):
             Generate a random Point object within the specified range.
+
+        random_batch(
+            n,
+            min_x,
+            max_x,
+            min_y,
+            max_y,
+            min_radius=0.1,
+            max_radius=10,
+            min_interval=0,
+            max_interval=100,
+            only_static=False,
+            only_dynamic=False,
+            random_recurrence=False,
+        ):
+            Generate multiple random Point objects within the specified range at once.
     """
 
+    __slots__ = ("_xy", "_geometry", "_buffered", "_buffered_key")
+
     def __init__(
         self,
         geometry: ShapelyPoint = None,
@@ -77,6 +104,14 @@ class Point(Geometry):
             radius (float, optional): The radius around the point, considered to be in collision.
             json_data (dict, optional): JSON data to load the point from.
         """
+        # raw coordinates of the point, the shapely geometry is only created once it is accessed
+        self._xy = None
+        self._geometry = None
+
+        # cache for the buffered geometry and the geometry / radius it was computed from
+        self._buffered = None
+        self._buffered_key = None
+
         if json_data is not None:
             self.load_from_json(json_data)
             return
@@ -84,6 +119,51 @@ class Point(Geometry):
         super().__init__(radius=radius, interval=time_interval, recurrence=recurrence)
         self.geometry = geometry
 
+    @property
+    def geometry(self):
+        """
+        Returns the shapely point representing the geometry. If the point was set from a coordinate
+        pair, the shapely point is only created on first access.
+
+        Returns:
+            ShapelyPoint: The shapely point or None, if no geometry is set.
+        """
+        if self._geometry is None and self._xy is not None:
+            self._geometry = ShapelyPoint(self._xy)
+
+        return self._geometry
+
+    @geometry.setter
+    def geometry(self, geometry: ShapelyPoint):
+        """
+        Sets the geometry from a shapely point.
+
+        Args:
+            geometry (ShapelyPoint): The shapely point or None.
+        """
+        # empty points have no coordinates, they are only kept as shapely geometry
+        self._geometry = geometry
+        if geometry is None or geometry.is_empty:
+            self._xy = None
+        else:
+            self._xy = (geometry.x, geometry.y)
+
+    @property
+    def buffered(self):
+        """
+        Returns the circular area around the point, which is considered to be in collision.
+        The buffered geometry is cached and only recomputed once the geometry or radius change.
+
+        Returns:
+            ShapelyPolygon: The geometry buffered by the radius.
+        """
+        key = self._buffered_key
+        if key is None or key[0] is not self.geometry or key[1] != self.radius:
+            self._buffered = self.geometry.buffer(self.radius)
+            self._buffered_key = (self.geometry, self.radius)
+
+        return self._buffered
+
     def set_geometry(self, x: float, y: float):
         """
         Sets the geometry from a coordinate pair.
@@ -92,7 +172,23 @@ class Point(Geometry):
             x (float): The x-coordinate.
             y (float): The y-coordinate.
         """
-        self.geometry = ShapelyPoint(x, y)
+        self._xy = (float(x), float(y))
+        self._geometry = None
+
+    def bbox(self):
+        """
+        Returns the axis-aligned bounding box of the point, including its radius.
+        It is computed from the raw coordinates without creating the shapely geometry.
+
+        Returns:
+            tuple: The bounding box as (min_x, min_y, max_x, max_y).
+        """
+        if self._xy is None:
+            return super().bbox()
+
+        x, y = self._xy
+        radius = self.radius if self.radius is not None else 0
+        return (x - radius, y - radius, x + radius, y + radius)
 
     def check_collision(
         self,
@@ -111,21 +207,50 @@ class Point(Geometry):
         Returns:
             bool: True if collision occurs, False otherwise. Objects without a time interval are considered to be always active.
         """
-        if self.is_active(query_time, query_interval):
-            if isinstance(shape, ShapelyPoint):
-                distance = self.geometry.distance(shape)
-            elif isinstance(shape, LineString):
-                distance = self.geometry.distance(shape)
-            elif isinstance(shape, Polygon):
-                distance = self.geometry.distance(shape)
-            else:
-                raise TypeError(
-                    "Invalid shape type. Only Point, LineString, or Polygon are supported."
-                )
+        # reject unsupported shapes up front, independently of the temporal query
+        if not isinstance(shape, (ShapelyPoint, LineString, Polygon)):
+            raise TypeError(
+                "Invalid shape type. Only Point, LineString, or Polygon are supported."
+            )
 
-            return distance <= self.radius
-        else:
-            return False
+        # resolve the temporal query before any geometric computation
+        if query_time is not None or query_interval is not None:
+            if not self.is_active(query_time, query_interval):
+                return False
+
+        return self.geometry.distance(shape) <= self.radius
+
+    def check_collision_batch(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        query_time: float = None,
+        query_interval: Interval = None,
+    ):
+        """
+        Checks a batch of coordinate pairs for collision with the point in a single vectorized pass.
+        The results are identical to calling check_collision with a ShapelyPoint for each pair.
+
+        Args:
+            xs (np.ndarray): The x-coordinates of the points to check.
+            ys (np.ndarray): The y-coordinates of the points to check.
+            query_time (optional): The specific time to check collision at.
+            query_interval (optional): The time interval to check collision within.
+
+        Returns:
+            np.ndarray: A boolean mask, which is True for all coordinate pairs in collision with the point.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+
+        # the activity does not depend on the queried coordinates, empty points never collide
+        if self._xy is None or not self.is_active(query_time, query_interval):
+            return np.zeros(xs.shape, dtype=bool)
+
+        x, y = self._xy
+        dx = xs - x
+        dy = ys - y
+        return np.sqrt(dx * dx + dy * dy) <= self.radius
 
     def plot(
         self,
@@ -157,7 +282,7 @@ class Point(Geometry):
         if not self.is_active(query_time, query_interval):
             if show_inactive:
                 if self.radius is not None and self.radius > 0:
-                    poly = self.geometry.buffer(self.radius)
+                    poly = self.buffered
                     plt.plot(*poly.exterior.xy, color=inactive_color)
                     plt.fill(*poly.exterior.xy, color=inactive_fill_color, alpha=0.05)
                 else:
@@ -171,7 +296,7 @@ class Point(Geometry):
         plt.figure(fig)
 
         if self.radius is not None and self.radius > 0:
-            poly = self.geometry.buffer(self.radius)
+            poly = self.buffered
             plt.plot(*poly.exterior.xy, color=color)
             plt.fill(*poly.exterior.xy, color=fill_color, alpha=opacity)
         else:
@@ -185,12 +310,18 @@ class Point(Geometry):
         Returns:
             Point: A copy of the point object.
         """
-        return Point(
-            geometry=self.geometry,
-            time_interval=self.time_interval,
-            recurrence=self.recurrence,
-            radius=self.radius,
-        )
+        # geometries and intervals are immutable, so the copy can share them (and the buffer cache)
+        # with the original point instead of going through the constructor
+        copy = Point.__new__(Point)
+        copy._xy = self._xy
+        copy._geometry = self._geometry
+        copy._time_interval = self._time_interval
+        copy._bounds = self._bounds
+        copy.recurrence = self.recurrence
+        copy.radius = self.radius
+        copy._buffered = self._buffered
+        copy._buffered_key = self._buffered_key
+        return copy
 
     def random(
         min_x: float,
@@ -264,23 +395,105 @@ class Point(Geometry):
                 radius=radius,
             )
 
+    def random_batch(
+        n: int,
+        min_x: float,
+        max_x: float,
+        min_y: float,
+        max_y: float,
+        min_radius: float,
+        max_radius: float,
+        min_interval: float = 0,
+        max_interval: float = 100,
+        only_static: bool = False,
+        only_dynamic: bool = False,
+        random_recurrence: bool = False,
+    ):
+        """
+        Generate multiple random Point objects within the specified range at once. The coordinates,
+        radii and time intervals of all points are sampled and the geometries created in a vectorized way.
+
+        Args:
+            n (int): The number of points to generate.
+            min_x (float): The minimum x-coordinate value.
+            max_x (float): The maximum x-coordinate value.
+            min_y (float): The minimum y-coordinate value.
+            max_y (float): The maximum y-coordinate value.
+            min_radius (float, optional): The minimum radius value. Defaults to 0.1.
+            max_radius (float, optional): The maximum radius value. Defaults to 10.
+            min_interval (float, optional): The minimum interval value. Defaults to 0.
+            max_interval (float, optional): The maximum interval value. Defaults to 100.
+            only_static (bool, optional): If True, only static points will be created. Defaults to False.
+            only_dynamic (bool, optional): If True, only dynamic points will be created. Defaults to False.
+            random_recurrence (bool, optional): If True, a random recurrence will be chosen. Defaults to False.
+
+        Returns:
+            list[Point]: A list of n randomly generated Point objects with the specified parameters.
+        """
+        geometries = shapely_points(
+            np.random.uniform(min_x, max_x, n), np.random.uniform(min_y, max_y, n)
+        )
+        radii = np.random.uniform(min_radius, max_radius, n)
+
+        # determine which points should be static - 50/50 chance if only_static is False
+        if only_static:
+            static = np.ones(n, dtype=bool)
+        elif only_dynamic:
+            static = np.zeros(n, dtype=bool)
+        else:
+            static = np.random.choice([True, False], n)
+
+        # sample the time intervals for all points, they are only used for dynamic ones
+        interval_starts = np.random.uniform(min_interval, max_interval, n)
+        interval_ends = np.random.uniform(interval_starts, max_interval)
+
+        points = []
+        for geometry, radius, is_static, interval_start, interval_end in zip(
+            geometries,
+            radii.tolist(),
+            static.tolist(),
+            interval_starts.tolist(),
+            interval_ends.tolist(),
+        ):
+            if is_static:
+                points.append(Point(geometry=geometry, radius=radius))
+                continue
+
+            time_interval = Interval(interval_start, interval_end, closed="both")
+
+            # choose random recurrence, if not disabled
+            recurrence = (
+                Recurrence.random(min_duration=time_interval.length)
+                if random_recurrence
+                else None
+            )
+
+            points.append(
+                Point(
+                    geometry=geometry,
+                    time_interval=time_interval,
+                    recurrence=recurrence,
+                    radius=radius,
+                )
+            )
+
+        return points
+
     def export_to_json(self):
         """
         Returns a JSON representation of the point object, using the corresponding exporting
-        function of the Geometry class and the stringified version of the geometry.
+        function of the Geometry class and the hex-encoded WKB representation of the geometry.
 
         Returns:
             str: A JSON representation of the point object.
         """
-        if self.geometry is None:
-            return {**super().export_to_json(), "geometry": "None"}
-
-        return {**super().export_to_json(), "geometry": self.geometry.wkt}
+        return {**super().export_to_json(), **geometry_to_json(self.geometry)}
 
     def load_from_json(self, json_object):
         """
         Loads the point object from a JSON representation, using the corresponding loading
-        function of the Geometry class and the stringified version of the geometry.
+        function of the Geometry class and the hex-encoded WKB representation of the geometry.
+        Representations containing the stringified version of the geometry are supported as well.
 
         Args:
             json_object (dict): The JSON representation of the point object.
@@ -289,8 +502,4 @@ class Point(Geometry):
             Object with updated attributes for both the geometry and the parent Geometry object
         """
         super().load_from_json(json_object)
-
-        if json_object["geometry"] == "None":
-            self.geometry = None
-        else:
-            self.geometry = wkt.loads(json_object["geometry"])
+        self.geometry = geometry_from_json(json_object)
@@ -1,12 +1,17 @@
 from shapely.geometry import Point, LineString, Polygon as ShapelyPolygon
-from shapely import wkt
+from shapely import (
+    dwithin,
+    convex_hull,
+    multipoints,
+    points as shapely_points,
+)
 from pandas import Interval
 from matplotlib.patches import Circle
 from typing import Union
 import matplotlib.pyplot as plt
 import numpy as np
 
-from .geometry import Geometry
+from .geometry import Geometry, geometry_to_json, geometry_from_json
 from src.util.recurrence import Recurrence
 
 
@@ -23,12 +28,18 @@ class Polygon(Geometry):
         __init__(self, geometry=None, time_interval=None, radius=0, json_data=None):
             Initializes a new instance of the Polygon class.
 
+        buffered(self):
+            Returns the area around the polygon, which is considered to be in collision.
+
         set_geometry(self, points):
             Sets the geometry from a list of coordinate pairs.
 
         check_collision(self, shape, query_time=None, query_interval=None):
             Checks if the polygon is in collision with a given shape. Touching time intervals are considered to be overlapping.
 
+        check_collision_batch(self, xs, ys, query_time=None, query_interval=None):
+            Checks a batch of coordinate pairs for collision with the polygon in a single vectorized pass.
+
         plot(self, query_time=None, query_interval=None, color="black", fill_color=None, opacity=1, show_inactive=False, inactive_color="grey", inactive_fill_color=None, fig=None):
             Plots the polygon with a circle of the corresponding radius around it.
             Optionally, only shows the polygon with the circle if it is active.
@@ -36,6 +47,12 @@ class Polygon(Geometry):
         copy(self):
             Creates a copy of the Polygon object.
 
+        random(min_x, max_x, min_y, max_y, max_size, min_radius, max_radius, min_points=3, max_points=7, min_interval=0, max_interval=100, only_static=False, only_dynamic=False, random_recurrence=False):
+            Creates a random polygon.
+
+        random_batch(n, min_x, max_x, min_y, max_y, max_size, min_radius, max_radius, min_points=3, max_points=7, min_interval=0, max_interval=100, only_static=False, only_dynamic=False, random_recurrence=False):
+            Creates multiple random polygons at once.
+
         save_to_json(self, filepath):
             Saves the polygon to a JSON file.
 
@@ -43,6 +60,8 @@ class Polygon(Geometry):
             Loads the polygon from JSON data.
     """
 
+    __slots__ = ("geometry", "_buffered", "_buffered_key")
+
     def __init__(
         self,
         geometry: ShapelyPolygon = None,
@@ -61,6 +80,10 @@ class Polygon(Geometry):
             radius (float, optional): The radius around the polygon, considered to be in collision.
             json_data (dict, optional): Optional JSON data to load the polygon from.
         """
+        # cache for the buffered geometry and the geometry / radius it was computed from
+        self._buffered = None
+        self._buffered_key = None
+
         if json_data is not None:
             self.load_from_json(json_data)
             return
@@ -68,6 +91,22 @@ class Polygon(Geometry):
         super().__init__(radius=radius, interval=time_interval, recurrence=recurrence)
         self.geometry = geometry
 
+    @property
+    def buffered(self):
+        """
+        Returns the area around the polygon, which is considered to be in collision.
+        The buffered geometry is cached and only recomputed once the geometry or radius change.
+
+        Returns:
+            ShapelyPolygon: The geometry buffered by the radius.
+        """
+        key = self._buffered_key
+        if key is None or key[0] is not self.geometry or key[1] != self.radius:
+            self._buffered = self.geometry.buffer(self.radius)
+            self._buffered_key = (self.geometry, self.radius)
+
+        return self._buffered
+
     def set_geometry(self, points: list[tuple[float, float]]):
         """
         Sets the geometry from a list of coordinate pairs.
@@ -94,22 +133,46 @@ class Polygon(Geometry):
         Returns:
             bool: True if collision occurs, False otherwise. Objects without a time interval are considered to be always active.
         """
-        if self.is_active(query_time, query_interval):
-            if isinstance(shape, Point):
-                distance = self.geometry.distance(shape)
-            elif isinstance(shape, LineString):
-                distance = self.geometry.distance(shape)
-            elif isinstance(shape, ShapelyPolygon):
-                distance = self.geometry.distance(shape)
-            else:
-                raise TypeError(
-                    "Invalid shape type. Only Point, LineString, or Polygon are supported."
-                )
+        # reject unsupported shapes up front, independently of the temporal query
+        if not isinstance(shape, (Point, LineString, ShapelyPolygon)):
+            raise TypeError(
+                "Invalid shape type. Only Point, LineString, or Polygon are supported."
+            )
 
-            return distance <= self.radius
-        else:
+        if not self.is_active(query_time, query_interval):
             return False
 
+        return self.geometry.distance(shape) <= self.radius
+
+    def check_collision_batch(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+        query_time: float = None,
+        query_interval: Interval = None,
+    ):
+        """
+        Checks a batch of coordinate pairs for collision with the polygon in a single vectorized pass.
+        The results are identical to calling check_collision with a ShapelyPoint for each pair.
+
+        Args:
+            xs (np.ndarray): The x-coordinates of the points to check.
+            ys (np.ndarray): The y-coordinates of the points to check.
+            query_time (optional): The specific time to check collision at.
+            query_interval (optional): The time interval to check collision within.
+
+        Returns:
+            np.ndarray: A boolean mask, which is True for all coordinate pairs in collision with the polygon.
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+
+        # the activity does not depend on the queried coordinates
+        if not self.is_active(query_time, query_interval):
+            return np.zeros(xs.shape, dtype=bool)
+
+        return dwithin(self.geometry, shapely_points(xs, ys), self.radius)
+
     def plot(
         self,
         query_time: float = None,
@@ -140,7 +203,7 @@ class Polygon(Geometry):
         if not self.is_active(query_time, query_interval):
             if show_inactive:
                 if self.radius is not None and self.radius > 0:
-                    poly = self.geometry.buffer(self.radius)
+                    poly = self.buffered
                     plt.plot(*poly.exterior.xy, color=inactive_color)
                     plt.fill(*poly.exterior.xy, color=inactive_fill_color, alpha=0.05)
                 else:
@@ -158,7 +221,7 @@ class Polygon(Geometry):
         plt.figure(fig)
 
         if self.radius is not None and self.radius > 0:
-            poly = self.geometry.buffer(self.radius)
+            poly = self.buffered
             plt.plot(*poly.exterior.xy, color=color)
             plt.fill(*poly.exterior.xy, color=fill_color, alpha=opacity)
         else:
@@ -172,12 +235,17 @@ class Polygon(Geometry):
         Returns:
             Polygon: A copy of the polygon object.
         """
-        return Polygon(
-            geometry=self.geometry,
-            time_interval=self.time_interval,
-            recurrence=self.recurrence,
-            radius=self.radius,
-        )
+        # geometries and intervals are immutable, so the copy can share them (and the derived caches)
+        # with the original polygon instead of going through the constructor
+        copy = Polygon.__new__(Polygon)
+        copy.geometry = self.geometry
+        copy._time_interval = self._time_interval
+        copy._bounds = self._bounds
+        copy.recurrence = self.recurrence
+        copy.radius = self.radius
+        copy._buffered = self._buffered
+        copy._buffered_key = self._buffered_key
+        return copy
 
     def random(
         min_x: float,
@@ -281,23 +349,144 @@ class Polygon(Geometry):
                 radius=radius,
             )
 
+    def random_batch(
+        n: int,
+        min_x: float,
+        max_x: float,
+        min_y: float,
+        max_y: float,
+        max_size: float,
+        min_radius: float,
+        max_radius: float,
+        min_points: int = 3,
+        max_points: int = 7,
+        min_interval: float = 0,
+        max_interval: float = 100,
+        only_static: bool = False,
+        only_dynamic: bool = False,
+        random_recurrence: bool = False,
+    ):
+        """
+        Creates multiple random polygons at once. The points, radii and time intervals of all polygons
+        are sampled and their convex hulls computed in a vectorized way.
+
+        Args:
+            n (int): The number of polygons to generate.
+            min_x (float): The minimum x coordinate.
+            max_x (float): The maximum x coordinate.
+            min_y (float): The minimum y coordinate.
+            max_y (float): The maximum y coordinate.
+            max_size (float): The maximum size of the polygons (without radius).
+            min_radius (float): The minimum radius of the polygons.
+            max_radius (float): The maximum radius of the polygons.
+            min_points (int, optional): The minimum number of points on the polygon edge.
+            max_points (int, optional): The maximum number of points on the polygon edge.
+            min_interval (float, optional): The minimum time interval.
+            max_interval (float, optional): The maximum time interval.
+            only_static (bool, optional): Whether to generate only static polygons.
+            only_dynamic (bool, optional): Whether to generate only dynamic polygons.
+            random_recurrence (bool, optional): Whether to generate a random recurrence.
+
+        Returns:
+            list[Polygon]: A list of n random polygons.
+        """
+        # generate a random number of points for every polygon
+        num_points = np.random.randint(min_points, max_points, n)
+
+        # generate the first point of every polygon
+        first_x = np.random.uniform(min_x, max_x, n)
+        first_y = np.random.uniform(min_y, max_y, n)
+
+        # generate the rest of the points at a maximum distance of max_size / 2 from the first point,
+        # sampling the maximum number of points for all polygons and only keeping the required ones
+        size_sqrt = np.sqrt(max_size / 2)
+        shape = (n, max_points - 2)
+        rest_x = np.random.uniform(
+            np.maximum(first_x - size_sqrt, min_x)[:, None],
+            np.minimum(first_x + size_sqrt, max_x)[:, None],
+            shape,
+        )
+        rest_y = np.random.uniform(
+            np.maximum(first_y - size_sqrt, min_y)[:, None],
+            np.minimum(first_y + size_sqrt, max_y)[:, None],
+            shape,
+        )
+        xs = np.column_stack([first_x, rest_x])
+        ys = np.column_stack([first_y, rest_y])
+        mask = np.arange(max_points - 1) < num_points[:, None]
+
+        # create the polygons as convex hulls of their points
+        hulls = convex_hull(
+            multipoints(
+                np.column_stack([xs[mask], ys[mask]]),
+                indices=np.repeat(np.arange(n), num_points),
+            )
+        )
+
+        # generate random radii
+        radii = np.random.uniform(min_radius, max_radius, n)
+
+        # determine which polygons should be static - 50/50 chance if only_static is False
+        if only_static:
+            static = np.ones(n, dtype=bool)
+        elif only_dynamic:
+            static = np.zeros(n, dtype=bool)
+        else:
+            static = np.random.choice([True, False], n)
+
+        # sample the time intervals for all polygons, they are only used for dynamic ones
+        interval_starts = np.random.uniform(min_interval, max_interval, n)
+        interval_ends = np.random.uniform(interval_starts, max_interval)
+
+        polygons = []
+        for hull, radius, is_static, interval_start, interval_end in zip(
+            hulls,
+            radii.tolist(),
+            static.tolist(),
+            interval_starts.tolist(),
+            interval_ends.tolist(),
+        ):
+            poly = hull if isinstance(hull, ShapelyPolygon) else ShapelyPolygon(hull)
+
+            if is_static:
+                polygons.append(Polygon(geometry=poly, radius=radius))
+                continue
+
+            time_interval = Interval(interval_start, interval_end, closed="both")
+
+            # choose random recurrence, if not disabled
+            recurrence = (
+                Recurrence.random(min_duration=time_interval.length)
+                if random_recurrence
+                else None
+            )
+
+            polygons.append(
+                Polygon(
+                    geometry=poly,
+                    time_interval=time_interval,
+                    recurrence=recurrence,
+                    radius=radius,
+                )
+            )
+
+        return polygons
+
     def export_to_json(self):
         """
         Returns a JSON representation of the polygon object, using the corresponding exporting
-        function of the Geometry class and the stringified version of the geometry.
+        function of the Geometry class and the hex-encoded WKB representation of the geometry.
 
         Returns:
             str: A JSON representation of the polygon object.
         """
-        if self.geometry is None:
-            return {**super().export_to_json(), "geometry": "None"}
-
-        return {**super().export_to_json(), "geometry": self.geometry.wkt}
+        return {**super().export_to_json(), **geometry_to_json(self.geometry)}
 
     def load_from_json(self, json_object):
         """
         Loads the polygon object from a JSON representation, using the corresponding loading
-        function of the Geometry class and the stringified version of the geometry.
+        function of the Geometry class and the hex-encoded WKB representation of the geometry.
+        Representations containing the stringified version of the geometry are supported as well.
 
         Args:
             json_object (dict): The JSON representation of the polygon object.
@@ -306,8 +495,4 @@ class Polygon(Geometry):
             Object with updated attributes for both the geometry and the parent Geometry object
         """
         super().load_from_json(json_object)
-
-        if json_object["geometry"] == "None":
-            self.geometry = None
-        else:
-            self.geometry = wkt.loads(json_object["geometry"])
+        self.geometry = geometry_from_json(json_object)
@@ -0,0 +1,29 @@
+import pytest
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "plot: tests that render matplotlib figures (deselect with -m 'not plot')",
+    )
+
+
+@pytest.fixture(scope="session")
+def plt():
+    """
+    Imports pyplot with the non-interactive Agg backend only once the first plotting test is run.
+    """
+    matplotlib = pytest.importorskip("matplotlib")
+    matplotlib.use("Agg")
+    return pytest.importorskip("matplotlib.pyplot")
+
+
+@pytest.fixture(scope="module")
+def fig(plt):
+    """
+    Provides a single figure, which is shared by the plotting tests of a module.
+    All figures, including the ones created implicitly by the tests, are closed afterwards.
+    """
+    figure = plt.figure()
+    yield figure
+    plt.close("all")
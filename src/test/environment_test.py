@@ -7,6 +7,7 @@ from shapely.geometry import (
     LineString as ShapelyLine,
 )
 
+from src.envs import environment
 from src.envs.environment import Environment
 from src.envs.environment_instance import EnvironmentInstance
 from src.obstacles.point import Point
@@ -221,6 +222,43 @@ class TestEnvironment:
         # remove the file
         os.remove("test_env.txt")
 
+    @pytest.mark.parametrize("serializer", ["json", "orjson"])
+    def test_save_load_serializer(self, tmp_path, monkeypatch, serializer):
+        # orjson is optional, so both serializers have to produce and read the same files
+        if serializer == "orjson":
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(environment, "orjson", None)
+
+        obstacles = [
+            Point(geometry=ShapelyPoint(0, 0), radius=1),
+            Line(
+                geometry=ShapelyLine([(2, 2), (3, 3)]),
+                time_interval=Interval(10, 25),
+                radius=0.5,
+                recurrence=Recurrence.HOURLY,
+            ),
+            Polygon(geometry=ShapelyPolygon([(6, 6), (7, 7), (8, 6)]), radius=3),
+        ]
+        # all obstacle types share the same geometry encoding
+        for obstacle in obstacles:
+            assert obstacle.export_to_json()["wkb"] == obstacle.geometry.wkb_hex
+
+        path = str(tmp_path / "test_env.json")
+        Environment(obstacles=obstacles).save(path)
+
+        loaded = Environment(filepath=path)
+        for original, obstacle in zip(obstacles, loaded.obstacles):
+            assert type(obstacle) is type(original)
+            assert obstacle.geometry == original.geometry
+            assert obstacle.time_interval == original.time_interval
+            assert obstacle.radius == original.radius
+            assert obstacle.recurrence == original.recurrence
+
+        # the file is plain JSON, independently of the serializer it was written with
+        monkeypatch.setattr(environment, "orjson", None)
+        assert len(Environment(filepath=path).obstacles) == len(obstacles)
+
     def test_add_random_obstacles(self):
         # Test case 1: only add obstacles of one type and check number of obstacles
         env1 = Environment()
@@ -4,7 +4,12 @@ import os
 from shapely.geometry import Polygon, Point, LineString
 from pandas import Interval
 
-from src.obstacles.geometry import Geometry
+from src.obstacles.geometry import (
+    Geometry,
+    _is_active_recurring,
+    geometry_to_json,
+    geometry_from_json,
+)
 from src.util.recurrence import Recurrence
 
 
@@ -149,6 +154,38 @@ class TestGeometry:
         assert geometry8.is_active(query_time=5) == True
         assert geometry8.is_active(query_interval=Interval(0, 10)) == True
 
+    def test_is_active_tuple_interval(self):
+        # plain tuples are treated as closed intervals
+        for recurrence in [Recurrence.NONE, Recurrence.MINUTELY]:
+            geometry = Geometry(1.0, Interval(5, 15, closed="left"), recurrence)
+            for bounds in [(0, 3), (0, 5), (3, 10), (15, 20), (20, 30), (60, 65)]:
+                assert geometry.is_active(query_interval=bounds) == geometry.is_active(
+                    query_interval=Interval(*bounds, closed="both")
+                )
+
+    def test_is_active_cache(self):
+        geometry = Geometry(1.0, Interval(5, 15, closed="both"), Recurrence.MINUTELY)
+        assert geometry.is_active(query_time=130) == True
+
+        # repeated queries are answered from the cache
+        hits = _is_active_recurring.cache_info().hits
+        assert geometry.is_active(query_time=130) == True
+        assert _is_active_recurring.cache_info().hits == hits + 1
+
+        # non-recurring queries bypass the cache
+        misses = _is_active_recurring.cache_info().misses
+        static = Geometry(1.0, Interval(5, 15, closed="both"))
+        assert static.is_active(query_time=10) == True
+        assert static.is_active(query_interval=Interval(20, 30)) == False
+        assert _is_active_recurring.cache_info().misses == misses
+
+        # the cache is keyed on the interval values, so changing the interval is respected
+        geometry.set_interval(0, 5)
+        assert geometry.is_active(query_time=130) == False
+        geometry.set_recurrence(Recurrence.NONE)
+        assert geometry.is_active(query_time=130) == False
+        assert geometry.is_active(query_time=5) == True
+
     def test_is_active_min_recurrence(self):
         ## TEST CASES WITH MINUTELY RECURRENCE
         # Test case 1: Query interval before first obstacle recurrence should always be inactive
@@ -370,3 +407,21 @@ class TestGeometry:
         assert loaded_geometry8.recurrence == Recurrence.DAILY
 
         os.remove("test_geometry_saving.txt")
+
+    @pytest.mark.parametrize(
+        "shape",
+        [Point(1, 2), LineString([(0, 0), (1, 1)]), Polygon([(0, 0), (1, 1), (1, 0)])],
+    )
+    def test_geometry_json(self, shape):
+        # all obstacle types share the hex-encoded WKB representation
+        json_data = geometry_to_json(shape)
+        assert json_data == {"wkb": shape.wkb_hex}
+        assert geometry_from_json(json_data) == shape
+
+        # stringified geometries are still supported
+        assert geometry_from_json({"geometry": shape.wkt}) == shape
+
+        # missing geometries are neither exported nor loaded
+        assert geometry_to_json(None) == {}
+        assert geometry_from_json({}) == None
+        assert geometry_from_json({"geometry": "None"}) == None
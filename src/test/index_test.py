@@ -0,0 +1,81 @@
+import pytest
+from shapely.geometry import (
+    Point as ShapelyPoint,
+    LineString,
+    Polygon as ShapelyPolygon,
+)
+from pandas import Interval
+import numpy as np
+
+from src.obstacles.point import Point
+from src.obstacles.line import Line
+from src.obstacles.polygon import Polygon
+from src.obstacles.index import ObstacleIndex
+
+
+class TestObstacleIndex:
+    def test_bbox(self):
+        point = Point(ShapelyPoint(1, 2), radius=0.5)
+        assert point.bbox() == (0.5, 1.5, 1.5, 2.5)
+
+        line = Line(LineString([(0, 0), (2, 1)]), radius=1)
+        assert line.bbox() == (-1, -1, 3, 2)
+
+        polygon = Polygon(ShapelyPolygon([(0, 0), (1, 1), (1, 0)]), radius=0)
+        assert polygon.bbox() == (0, 0, 1, 1)
+
+    def test_query(self):
+        static = Point(ShapelyPoint(0, 0), radius=1)
+        dynamic = Point(ShapelyPoint(5, 5), Interval(0, 10, closed="both"), radius=1)
+        line = Line(LineString([(10, 0), (10, 10)]), radius=0.5)
+        index = ObstacleIndex([static, dynamic, line])
+
+        # only obstacles with intersecting bounding boxes are returned
+        assert index.query(ShapelyPoint(0.5, 0.5)) == [static]
+        assert index.query(ShapelyPoint(5, 5)) == [dynamic]
+        assert index.query(ShapelyPoint(10.5, 5)) == [line]
+        assert index.query(ShapelyPoint(20, 20)) == []
+        assert index.query(LineString([(0, 0), (10, 5)])) == [static, dynamic, line]
+
+        # inactive obstacles are filtered out
+        assert index.query(ShapelyPoint(5, 5), query_time=5) == [dynamic]
+        assert index.query(ShapelyPoint(5, 5), query_time=15) == []
+        assert (
+            index.query(
+                ShapelyPoint(5, 5), query_interval=Interval(15, 25, closed="both")
+            )
+            == []
+        )
+        assert index.query(ShapelyPoint(0, 0), query_time=15) == [static]
+
+    def test_query_random(self):
+        np.random.seed(0)
+        obstacles = [
+            Point.random(0, 100, 0, 100, 1, 5, only_dynamic=True) for _ in range(100)
+        ]
+        index = ObstacleIndex(obstacles)
+
+        # the index must not prune any obstacle in collision
+        for _ in range(50):
+            query = ShapelyPoint(*np.random.uniform(0, 100, 2))
+            query_time = np.random.uniform(0, 100)
+            candidates = index.query(query, query_time=query_time)
+            expected = [
+                obstacle
+                for obstacle in obstacles
+                if obstacle.check_collision(query, query_time=query_time)
+            ]
+            assert all(obstacle in candidates for obstacle in expected)
+
+    def test_query_boundary(self):
+        # the query point lies at a distance of exactly the radius, but just outside of the rounded bounds
+        obstacle = Point(ShapelyPoint(0.321, 0), radius=0.44)
+        query = ShapelyPoint(-0.11900000000000001, 0)
+        assert query.x < obstacle.bbox()[0]
+        assert obstacle.check_collision(query)
+
+        index = ObstacleIndex([obstacle])
+        assert index.query(query) == [obstacle]
+
+        # shapes clearly further away than the radius are still pruned
+        assert index.query(ShapelyPoint(-0.12, 0)) == []
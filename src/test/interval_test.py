@@ -0,0 +1,43 @@
+from pandas import Interval as PandasInterval
+
+from src.util.interval import Interval
+
+
+class TestInterval:
+    def test_from_pandas(self):
+        interval = Interval.from_pandas(PandasInterval(0, 10, closed="left"))
+        assert interval == Interval(0, 10, True, False)
+        assert Interval.from_pandas(None) is None
+
+        # intervals are closed on both sides by default
+        assert Interval(0, 10) == Interval(0, 10, True, True)
+
+    def test_shift(self):
+        interval = Interval(0, 10, False, True)
+        assert interval.shift(5) == Interval(5, 15, False, True)
+        assert interval.shift(-5) == Interval(-5, 5, False, True)
+
+    def test_pandas_equivalence(self):
+        # the numeric checks have to agree with pandas for all closedness combinations
+        closed_options = ["both", "left", "right", "neither"]
+        bounds = [(0, 10), (5, 15), (10, 20), (15, 25), (-5, 0), (10, 10)]
+
+        for closed in closed_options:
+            for left, right in bounds:
+                pandas_interval = PandasInterval(left, right, closed=closed)
+                interval = Interval.from_pandas(pandas_interval)
+                for value in [-5, 0, 5, 10, 15, 20]:
+                    assert interval.contains(value) == (value in pandas_interval)
+
+                for other_closed in closed_options:
+                    for other_left, other_right in bounds:
+                        other = PandasInterval(
+                            other_left, other_right, closed=other_closed
+                        )
+                        expected = pandas_interval.overlaps(other)
+
+                        # other intervals can be given as pandas or numeric intervals
+                        assert interval.overlaps(other) == expected
+                        assert (
+                            interval.overlaps(Interval.from_pandas(other)) == expected
+                        )
@@ -1,22 +1,41 @@
 import pytest
 import json
-import os
 from shapely.geometry import Point, LineString as ShapelyLine, Polygon as ShapelyPolygon
 from pandas import Interval
-from matplotlib import pyplot as plt
+import numpy as np
 
 from src.obstacles.line import Line
 from src.util.recurrence import Recurrence
 
+# shared geometries, which are immutable and can be reused across tests
+_LINE_00_11 = ShapelyLine([(0, 0), (1, 1)])
+_LINE_22_33 = ShapelyLine([(2, 2), (3, 3)])
+_LINE_05_15 = ShapelyLine([(0.5, 0.5), (1.5, 1.5)])
+_LINE_00_22 = ShapelyLine([(0, 0), (1, 1), (2, 2)])
+_SQUARE_00_11 = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+_SQUARE_22_33 = ShapelyPolygon([(2, 2), (2, 3), (3, 3), (3, 2)])
+_P05 = Point(0.5, 0.5)
+_P22 = Point(2, 2)
+
+_IV_0_10 = Interval(0, 10, closed="both")
+_IV_5_15 = Interval(5, 15, closed="both")
+_IV_15_25 = Interval(15, 25, closed="both")
+
+_VALID_RECURRENCES = frozenset(
+    (Recurrence.NONE, Recurrence.MINUTELY, Recurrence.HOURLY, Recurrence.DAILY)
+)
+
 
 class TestLine:
-    def setup_method(self):
-        line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+    @pytest.fixture(scope="class")
+    @classmethod
+    def base_line(cls):
+        # shared by all tests of the class, tests mutating the line have to work on a copy
+        return Line(
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
-        return line
 
     def test_setup(self):
         # Test constructor with out anything
@@ -27,59 +46,59 @@ class TestLine:
         assert line.recurrence == Recurrence.NONE
 
         # Test constructor with start and end points
-        line = Line(geometry=ShapelyLine([(0, 0), (1, 1)]))
-        assert line.geometry == ShapelyLine([(0, 0), (1, 1)])
+        line = Line(geometry=_LINE_00_11)
+        assert line.geometry == _LINE_00_11
         assert line.time_interval == None
         assert line.radius == 0
         assert line.recurrence == Recurrence.NONE
 
         # Test constructor with start and end points, time interval, and radius
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
-        assert line.geometry == ShapelyLine([(0, 0), (1, 1)])
-        assert line.time_interval == Interval(0, 10, closed="both")
+        assert line.geometry == _LINE_00_11
+        assert line.time_interval == _IV_0_10
         assert line.radius == 1.0
         assert line.recurrence == Recurrence.NONE
 
         # Test constructor with start and end points, time interval, radius, and recurrence
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
             recurrence=Recurrence.MINUTELY,
         )
-        assert line.geometry == ShapelyLine([(0, 0), (1, 1)])
-        assert line.time_interval == Interval(0, 10, closed="both")
+        assert line.geometry == _LINE_00_11
+        assert line.time_interval == _IV_0_10
         assert line.radius == 1.0
         assert line.recurrence == Recurrence.MINUTELY
 
-    def test_set_geometry(self):
-        line = self.setup_method()
+    def test_set_geometry(self, base_line):
+        line = base_line.copy()
         line.set_geometry([(1, 2), (1, 1)])
         assert line.geometry == ShapelyLine([(1, 2), (1, 1)])
 
-    def test_set_interval(self):
-        line = self.setup_method()
+    def test_set_interval(self, base_line):
+        line = base_line.copy()
         line.set_interval(5, 15)
-        assert line.time_interval == Interval(5, 15, closed="both")
+        assert line.time_interval == _IV_5_15
 
-    def test_set_radius(self):
-        line = self.setup_method()
+    def test_set_radius(self, base_line):
+        line = base_line.copy()
         line.set_radius(2.0)
         assert line.radius == 2.0
 
-    def test_check_collision_with_point(self):
-        line = self.setup_method()
+    def test_check_collision_with_point(self, base_line):
+        line = base_line
 
         # collision check with point outside
-        point = Point(2, 2)
+        point = _P22
         assert line.check_collision(point) == False
 
         # collision check with point inside
-        point = Point(0.5, 0.5)
+        point = _P05
         assert line.check_collision(point) == True
 
         # collision check with point on the edge
@@ -94,19 +113,19 @@ class TestLine:
         point = Point(1.75, 1.75)
         assert line.check_collision(point) == False
 
-    def test_check_collision_with_line_string(self):
-        line = self.setup_method()
+    def test_check_collision_with_line_string(self, base_line):
+        line = base_line
 
         # collision check with line outside
-        other_line = ShapelyLine([(2, 2), (3, 3)])
+        other_line = _LINE_22_33
         assert line.check_collision(other_line) == False
 
         # collision check with line passing through
-        other_line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
+        other_line = _LINE_00_22
         assert line.check_collision(other_line) == True
 
         # collision check with line on the edge
-        other_line = ShapelyLine([(0.5, 0.5), (1.5, 1.5)])
+        other_line = _LINE_05_15
         assert line.check_collision(other_line) == True
 
         # collision check with line inside radius region
@@ -119,12 +138,12 @@ class TestLine:
 
         # check collision with recurring line
         line_rec = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(5, 15, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_5_15,
             recurrence=Recurrence.MINUTELY,
         )
-        colliding_line = ShapelyLine([(0.5, 0.5), (1.5, 1.5)])
-        non_colliding_line = ShapelyLine([(2, 2), (3, 3)])
+        colliding_line = _LINE_05_15
+        non_colliding_line = _LINE_22_33
 
         assert line_rec.check_collision(colliding_line, query_time=0) == False
         assert line_rec.check_collision(non_colliding_line, query_time=0) == False
@@ -198,15 +217,15 @@ class TestLine:
             == False
         )
 
-    def test_check_collision_with_polygon(self):
-        line = self.setup_method()
+    def test_check_collision_with_polygon(self, base_line):
+        line = base_line
 
         # collision check with polygon outside
-        polygon = ShapelyPolygon([(2, 2), (2, 3), (3, 3), (3, 2)])
+        polygon = _SQUARE_22_33
         assert line.check_collision(polygon) == False
 
         # collision check with polygon containing line
-        polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+        polygon = _SQUARE_00_11
         assert line.check_collision(polygon) == True
 
         # collision check with polygon on the edge
@@ -221,167 +240,168 @@ class TestLine:
         polygon = ShapelyPolygon([(1.75, 1.75), (1.75, 2.5), (2.5, 2.5), (2.5, 1.75)])
         assert line.check_collision(polygon) == False
 
-    def test_check_collision_with_invalid_shape(self):
-        line = self.setup_method()
+    def test_check_collision_with_invalid_shape(self, base_line):
+        line = base_line
         with pytest.raises(TypeError):
             line.check_collision("invalid shape")
 
-    def test_temporal_collision_check(self):
-        in1 = Interval(0, 10, closed="both")
-        in2 = Interval(5, 15, closed="both")
-        in3 = Interval(15, 25, closed="both")
-
-        line = self.setup_method()
-        test_line = ShapelyLine([(0.5, 0.5), (1.5, 1.5)])
-
-        # collision check with line inside spatial area
+        # invalid shapes are rejected even if the line is inactive
+        with pytest.raises(TypeError):
+            line.check_collision("invalid shape", query_time=15)
+
+    @pytest.mark.parametrize(
+        "shape, spatial_collision",
+        [
+            # line inside spatial area
+            (_LINE_05_15, True),
+            # line outside spatial area
+            (ShapelyLine([(5.5, 5.5), (6.5, 6.5)]), False),
+            # line on the edge of spatial area
+            (ShapelyLine([(1, 1), (2, 2)]), True),
+            # point inside spatial area
+            (_P05, True),
+            # polygon overlapping spatial area
+            (_SQUARE_00_11, True),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "query, active",
+        [
+            ({"query_time": 5}, True),
+            ({"query_interval": _IV_0_10}, True),
+            ({"query_time": 15}, False),
+            ({"query_interval": _IV_15_25}, False),
+        ],
+    )
+    def test_temporal_collision_check(
+        self, base_line, shape, spatial_collision, query, active
+    ):
+        line = base_line.copy()
         line.set_interval(0, 10)
-        assert line.is_active(query_time=5) == True
-        assert line.check_collision(test_line, query_time=5) == True
-        assert line.is_active(query_interval=in1) == True
-        assert line.check_collision(test_line, query_interval=in1) == True
-        assert line.is_active(query_time=15) == False
-        assert line.check_collision(test_line, query_time=15) == False
-        assert line.is_active(query_interval=in3) == False
-        assert line.check_collision(test_line, query_interval=in3) == False
-
-        # collision check with line outside spatial area
-        test_line = ShapelyLine([(5.5, 5.5), (6.5, 6.5)])
-        assert line.check_collision(test_line, query_time=5) == False
-        assert line.check_collision(test_line, query_interval=in1) == False
-        assert line.check_collision(test_line, query_time=15) == False
-        assert line.check_collision(test_line, query_interval=in3) == False
-
-        # collision check with line on the edge of spatial area
-        test_line = ShapelyLine([(1, 1), (2, 2)])
-        assert line.check_collision(test_line, query_time=5) == True
-        assert line.check_collision(test_line, query_interval=in1) == True
-        assert line.check_collision(test_line, query_time=15) == False
-        assert line.check_collision(test_line, query_interval=in3) == False
-
-        # collision check with point and different temporal queries
-        point = Point(0.5, 0.5)
-        assert line.check_collision(point, query_time=5) == True
-        assert line.check_collision(point, query_interval=in1) == True
-        assert line.check_collision(point, query_time=15) == False
-        assert line.check_collision(point, query_interval=in3) == False
 
-        # collision check with polygon and different temporal queries
-        polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
-        assert line.check_collision(polygon, query_time=5) == True
-        assert line.check_collision(polygon, query_interval=in1) == True
-        assert line.check_collision(polygon, query_time=15) == False
-        assert line.check_collision(polygon, query_interval=in3) == False
+        assert line.is_active(**query) == active
+        assert line.check_collision(shape, **query) == (spatial_collision and active)
 
     def test_check_collision_without_time_interval(self):
-        line = Line(geometry=ShapelyLine([(0, 0), (1, 1)]), radius=1.0)
+        line = Line(geometry=_LINE_00_11, radius=1.0)
 
         # collision check with point outside
-        point = Point(2, 2)
+        point = _P22
         assert line.check_collision(point) == False
 
         # collision check with point inside
-        point = Point(0.5, 0.5)
+        point = _P05
         assert line.check_collision(point) == True
 
         # collision check with point inside at arbitrary time
-        point = Point(0.5, 0.5)
+        point = _P05
         assert line.check_collision(point, query_time=5) == True
 
         # collision check with point outside at arbitrary time
-        point = Point(2, 2)
+        point = _P22
         assert line.check_collision(point, query_time=5) == False
 
         # collision check with line inside
-        other_line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
+        other_line = _LINE_00_22
         assert line.check_collision(other_line) == True
 
         # collision check with line outside
-        other_line = ShapelyLine([(2, 2), (3, 3)])
+        other_line = _LINE_22_33
         assert line.check_collision(other_line) == False
 
         # collision check with line inside at arbitrary time
-        other_line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
+        other_line = _LINE_00_22
         assert line.check_collision(other_line, query_time=5) == True
 
         # collision check with line outside at arbitrary time
-        other_line = ShapelyLine([(2, 2), (3, 3)])
+        other_line = _LINE_22_33
         assert line.check_collision(other_line, query_time=5) == False
 
         # collision check with polygon inside
-        polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+        polygon = _SQUARE_00_11
         assert line.check_collision(polygon) == True
 
         # collision check with polygon outside
-        polygon = ShapelyPolygon([(2, 2), (2, 3), (3, 3), (3, 2)])
+        polygon = _SQUARE_22_33
         assert line.check_collision(polygon) == False
 
         # collision check with polygon inside at arbitrary time
-        polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
+        polygon = _SQUARE_00_11
         assert line.check_collision(polygon, query_time=5) == True
 
         # collision check with polygon outside at arbitrary time
-        polygon = ShapelyPolygon([(2, 2), (2, 3), (3, 3), (3, 2)])
+        polygon = _SQUARE_22_33
         assert line.check_collision(polygon, query_time=5) == False
 
-    def test_plot(self):
-        fig = plt.figure()
-
+    @pytest.mark.plot
+    def test_plot(self, fig):
         # Test case 1: No query time or query interval provided
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
         line.plot(fig=fig)  # Plot the line
 
+        fig.clear()
+
         # Test case 2: Query time is provided, but line has no time interval
-        line = Line(geometry=ShapelyLine([(2, 2), (3, 3)]))
+        line = Line(geometry=_LINE_22_33)
         line.plot(query_time=5, fig=fig)
 
+        fig.clear()
+
         # Test case 3: Query time is within the line's time interval
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
         line.plot(query_time=5, fig=fig)  # Plot the line at query time 5
 
+        fig.clear()
+
         # Test case 4: Query interval overlaps with the line's time interval
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
         line.plot(query_interval=Interval(5, 15), fig=fig)
 
+        fig.clear()
+
         # Test case 5: Query time is outside the line's time interval
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
         line.plot(query_time=15, fig=fig)
 
+        fig.clear()
+
         # Test case 6: Query interval does not overlap with the line's time interval
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
         line.plot(query_interval=Interval(15, 25), fig=fig)
 
+        fig.clear()
+
         # Test case 7: No figure provided
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
         )
         line.plot()  # Plot the line on a new figure
 
-    def test_load_save(self):
+    def test_load_save(self, tmp_path):
         radius = 5.5
-        line = ShapelyLine([(0, 0), (1, 1)])
+        line = _LINE_00_11
         time_interval = Interval(0, 10, closed="left")
 
         # Test case 1: Convert line object to JSON and back (only geometry)
@@ -463,11 +483,9 @@ class TestLine:
         )
         json_8 = ln_8.export_to_json()
 
-        with open("test_line_saving.txt", "w") as f:
-            json.dump(json_8, f)
-
-        with open("test_line_saving.txt", "r") as f:
-            json_obj8_loaded = json.load(f)
+        path = tmp_path / "test_line_saving.json"
+        path.write_bytes(json.dumps(json_8).encode())
+        json_obj8_loaded = json.loads(path.read_bytes())
 
         loaded_8 = Line(json_data=json_obj8_loaded)
         assert loaded_8.geometry == line
@@ -475,12 +493,27 @@ class TestLine:
         assert loaded_8.radius == radius
         assert loaded_8.recurrence == Recurrence.DAILY
 
-        os.remove("test_line_saving.txt")
+    def test_load_stringified_geometry(self):
+        # Load line object from JSON with the stringified geometry
+        json_data = {
+            "radius": "5.5",
+            "interval": str(Interval(0, 10, closed="left")),
+            "recurrence": Recurrence.NONE.to_string(),
+            "geometry": _LINE_00_11.wkt,
+        }
+        loaded = Line(json_data=json_data)
+        assert loaded.geometry == _LINE_00_11
+        assert loaded.time_interval == Interval(0, 10, closed="left")
+        assert loaded.radius == 5.5
+
+        # Load line object from JSON without a stringified geometry
+        loaded = Line(json_data={**json_data, "geometry": "None"})
+        assert loaded.geometry == None
 
     def test_copy(self):
         line = Line(
-            geometry=ShapelyLine([(0, 0), (1, 1)]),
-            time_interval=Interval(0, 10, closed="both"),
+            geometry=_LINE_00_11,
+            time_interval=_IV_0_10,
             radius=1.0,
             recurrence=Recurrence.MINUTELY,
         )
@@ -518,11 +551,9 @@ class TestLine:
             max_size=max_size,
         )
 
-        coords = ln1.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln1.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln1.time_interval == None or (
             ln1.time_interval.left >= min_interval_default
             and ln1.time_interval.right <= max_interval_default
@@ -545,11 +576,9 @@ class TestLine:
             max_radius=max_radius,
             max_size=max_size,
         )
-        coords = ln2.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln2.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln2.time_interval == None or (
             ln2.time_interval.left >= min_interval_default
             and ln2.time_interval.right <= max_interval_default
@@ -568,11 +597,9 @@ class TestLine:
             max_size=max_size,
             only_static=True,
         )
-        coords = ln3.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln3.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln3.time_interval == None
         assert ln3.radius >= min_radius and ln3.radius <= max_radius
         assert ln3.recurrence == Recurrence.NONE
@@ -593,11 +620,9 @@ class TestLine:
             max_size=max_size,
             only_static=True,
         )
-        coords = ln4.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln4.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln4.time_interval == None
         assert ln4.radius >= min_radius and ln4.radius <= max_radius
         assert ln4.recurrence == Recurrence.NONE
@@ -621,20 +646,13 @@ class TestLine:
             only_dynamic=True,
             random_recurrence=True,
         )
-        coords = ln5.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln5.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln5.time_interval.left >= min_interval_default
         assert ln5.time_interval.right <= max_interval_default
         assert ln5.radius >= min_radius and ln5.radius <= max_radius
-        assert ln5.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert ln5.recurrence in _VALID_RECURRENCES
 
         ln6 = Line.random(
             min_x=min_x,
@@ -647,20 +665,13 @@ class TestLine:
             only_dynamic=True,
             random_recurrence=True,
         )
-        coords = ln6.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln6.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln6.time_interval.left >= min_interval_default
         assert ln6.time_interval.right <= max_interval_default
         assert ln6.radius >= min_radius and ln6.radius <= max_radius
-        assert ln6.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert ln6.recurrence in _VALID_RECURRENCES
 
         ln7 = Line.random(
             min_x=min_x,
@@ -673,20 +684,13 @@ class TestLine:
             only_dynamic=True,
             random_recurrence=True,
         )
-        coords = ln7.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln7.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln7.time_interval.left >= min_interval_default
         assert ln7.time_interval.right <= max_interval_default
         assert ln7.radius >= min_radius and ln7.radius <= max_radius
-        assert ln7.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert ln7.recurrence in _VALID_RECURRENCES
 
         # Test case 4 - dynamic lines with custom time interval
         min_interval = 100
@@ -705,20 +709,13 @@ class TestLine:
             only_dynamic=True,
             random_recurrence=True,
         )
-        coords = ln8.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln8.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln8.time_interval.left >= min_interval
         assert ln8.time_interval.right <= max_interval
         assert ln8.radius >= min_radius and ln8.radius <= max_radius
-        assert ln8.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert ln8.recurrence in _VALID_RECURRENCES
 
         ln9 = Line.random(
             min_x=min_x,
@@ -733,20 +730,13 @@ class TestLine:
             only_dynamic=True,
             random_recurrence=True,
         )
-        coords = ln9.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln9.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln9.time_interval.left >= min_interval
         assert ln9.time_interval.right <= max_interval
         assert ln9.radius >= min_radius and ln9.radius <= max_radius
-        assert ln9.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert ln9.recurrence in _VALID_RECURRENCES
 
         ln10 = Line.random(
             min_x=min_x,
@@ -760,11 +750,9 @@ class TestLine:
             max_size=max_size,
             only_dynamic=True,
         )
-        coords = ln10.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
+        (x0, y0), (x1, y1) = ln10.geometry.coords
+        assert min_x <= x0 <= max_x and min_y <= y0 <= max_y
+        assert min_x <= x1 <= max_x and min_y <= y1 <= max_y
         assert ln10.time_interval.left >= min_interval
         assert ln10.time_interval.right <= max_interval
         assert ln10.radius >= min_radius and ln10.radius <= max_radius
@@ -793,26 +781,6 @@ class TestLine:
             only_dynamic=True,
             random_recurrence=True,
         )
-        coords = ln11.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
-        assert ln11.radius >= min_radius and ln11.radius <= max_radius
-
-        # check if line is static or not and test accordingly
-        if ln11.time_interval == None:
-            assert ln11.recurrence == Recurrence.NONE
-        else:
-            assert ln11.time_interval.left >= min_interval
-            assert ln11.time_interval.right <= max_interval
-            assert ln11.recurrence in [
-                Recurrence.NONE,
-                Recurrence.MINUTELY,
-                Recurrence.HOURLY,
-                Recurrence.DAILY,
-            ]
-
         ln12 = Line.random(
             min_x=min_x,
             max_x=max_x,
@@ -825,27 +793,6 @@ class TestLine:
             max_size=max_size,
             random_recurrence=True,
         )
-
-        coords = ln12.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
-        assert ln12.radius >= min_radius and ln12.radius <= max_radius
-
-        # check if line is static or not and test accordingly
-        if ln12.time_interval == None:
-            assert ln12.recurrence == Recurrence.NONE
-        else:
-            assert ln12.time_interval.left >= min_interval
-            assert ln12.time_interval.right <= max_interval
-            assert ln12.recurrence in [
-                Recurrence.NONE,
-                Recurrence.MINUTELY,
-                Recurrence.HOURLY,
-                Recurrence.DAILY,
-            ]
-
         ln13 = Line.random(
             min_x=min_x,
             max_x=max_x,
@@ -859,22 +806,18 @@ class TestLine:
             random_recurrence=True,
         )
 
-        coords = ln13.geometry.coords
-        assert coords[0][0] >= min_x and coords[0][0] <= max_x
-        assert coords[0][1] >= min_y and coords[0][1] <= max_y
-        assert coords[1][0] >= min_x and coords[1][0] <= max_x
-        assert coords[1][1] >= min_y and coords[1][1] <= max_y
-        assert ln13.radius >= min_radius and ln13.radius <= max_radius
-
-        # check if line is static or not and test accordingly
-        if ln13.time_interval == None:
-            assert ln13.recurrence == Recurrence.NONE
-        else:
-            assert ln13.time_interval.left >= min_interval
-            assert ln13.time_interval.right <= max_interval
-            assert ln13.recurrence in [
-                Recurrence.NONE,
-                Recurrence.MINUTELY,
-                Recurrence.HOURLY,
-                Recurrence.DAILY,
-            ]
+        # check the end points of all lines at once
+        coords = np.array([ln.geometry.coords for ln in (ln11, ln12, ln13)])
+        assert np.all((coords[:, :, 0] >= min_x) & (coords[:, :, 0] <= max_x))
+        assert np.all((coords[:, :, 1] >= min_y) & (coords[:, :, 1] <= max_y))
+
+        for ln in (ln11, ln12, ln13):
+            assert ln.radius >= min_radius and ln.radius <= max_radius
+
+            # check if line is static or not and test accordingly
+            if ln.time_interval == None:
+                assert ln.recurrence == Recurrence.NONE
+            else:
+                assert ln.time_interval.left >= min_interval
+                assert ln.time_interval.right <= max_interval
+                assert ln.recurrence in _VALID_RECURRENCES
@@ -1,372 +1,429 @@
 import pytest
 import json
-import os
 from shapely.geometry import (
     Point as ShapelyPoint,
     LineString as ShapelyLine,
     Polygon as ShapelyPolygon,
 )
+from shapely import (
+    box,
+    get_coordinates,
+    points,
+    linestrings,
+    polygons,
+    dwithin,
+)
 from pandas import Interval
-from matplotlib import pyplot as plt
+import numpy as np
 
 from src.obstacles.polygon import Polygon
+from src.obstacles.index import ObstacleIndex
 from src.util.recurrence import Recurrence
 
+# shared geometries, which are immutable and can be reused across tests
+(
+    _TRIANGLE,
+    _COLLINEAR_00_33,
+    _COLLINEAR_00_22,
+    _COLLINEAR_05_25,
+    _COLLINEAR_11_33,
+    _COLLINEAR_55_75,
+) = polygons(
+    [
+        [(0, 0), (1, 1), (1, 0)],
+        [(0, 0), (1, 1), (3, 3)],
+        [(0, 0), (1, 1), (2, 2)],
+        [(0.5, 0.5), (1.5, 1.5), (2.5, 2.5)],
+        [(1, 1), (2, 2), (3, 3)],
+        [(5.5, 5.5), (6.5, 6.5), (7.5, 7.5)],
+    ]
+)
+_SQUARE_00_11, _SQUARE_33_44 = box([0, 3], [0, 3], [1, 4], [1, 4])
+# degenerated polygons touching the collision area of _COLLINEAR_00_22 and lying just outside of it
+_TOUCHING_33, _OUTSIDE_33 = polygons(
+    [[(3, 3), (2, 3), (3, 3), (3, 2)], [(3, 3), (4, 3), (3, 3), (3, 5)]]
+)
+_LINE_00_22 = ShapelyLine([(0, 0), (1, 1), (2, 2)])
+_LINE_44_33 = ShapelyLine([(4, 4), (3, 3)])
+_P05 = ShapelyPoint(0.5, 0.5)
+_P33 = ShapelyPoint(3, 3)
+_IV_5_15 = Interval(5, 15, closed="both")
+_VALID_RECURRENCES = frozenset(
+    (Recurrence.NONE, Recurrence.MINUTELY, Recurrence.HOURLY, Recurrence.DAILY)
+)
+
+# shapes outside, inside, on the edge, inside the radius region and slightly outside the
+# collision area of the triangle with unit radius
+_POINT_CASES = [
+    (ShapelyPoint(2, 2), False),
+    (_P05, True),
+    (ShapelyPoint(0.75, 0.5), True),
+    (ShapelyPoint(1, 1), True),
+    (ShapelyPoint(1.5, 1.5), True),
+    (ShapelyPoint(1.75, 1.75), False),
+]
+_LINE_CASES = [
+    (ShapelyLine([(2, 2), (3, 3)]), False),
+    (_LINE_00_22, True),
+    (ShapelyLine([(0.5, 0.5), (1.5, 1.5)]), True),
+    (ShapelyLine([(1.5, 1.5), (2.5, 2.5)]), True),
+    (ShapelyLine([(1.75, 1.75), (2.5, 2.5)]), False),
+]
+_POLYGON_CASES = [
+    (box(2, 2, 3, 3), False),
+    (_SQUARE_00_11, True),
+    (box(0.5, 0.5, 1.5, 1.5), True),
+    (box(1.5, 1.5, 2.5, 2.5), True),
+    (box(1.75, 1.75, 2.5, 2.5), False),
+]
+
+# radius, temporal query and whether the shared figure is passed for the plotting scenarios:
+# no figure provided, plotting on an existing figure and plotting with temporal arguments
+_PLOT_CASES = [
+    (0, {}, False),
+    (0, {}, True),
+    (1.0, {"query_time": 5}, True),
+    (1.0, {"query_interval": Interval(0, 10)}, True),
+]
+
+# temporal queries against the triangle recurring every minute during [5, 15], together with
+# the expected collision state for a polygon within its radius (polygons outside never collide)
+_RECURRENCE_QUERIES = [
+    ({"query_time": 0}, False),
+    ({"query_time": 10}, True),
+    ({"query_time": 20}, False),
+    ({"query_interval": Interval(0, 3)}, False),
+    ({"query_interval": Interval(3, 10)}, True),
+    ({"query_interval": Interval(10, 15)}, True),
+    ({"query_time": 120}, False),
+    ({"query_time": 130}, True),
+    ({"query_time": 140}, False),
+    ({"query_interval": Interval(120, 123)}, False),
+    ({"query_interval": Interval(125, 130)}, True),
+    ({"query_interval": Interval(130, 140)}, True),
+]
+_RECURRENCE_CASES = [
+    (other, query, expected and other is _SQUARE_00_11)
+    for query, expected in _RECURRENCE_QUERIES
+    for other in (_SQUARE_00_11, _SQUARE_33_44)
+]
+
 
 class TestPolygon:
-    def setup_method(self):
-        polygon = Polygon(
-            geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]),
+    @pytest.fixture(scope="class")
+    @classmethod
+    def base_polygon(cls):
+        # shared by all tests of the class, tests mutating the polygon have to work on a copy
+        return Polygon(
+            geometry=_TRIANGLE,
             time_interval=Interval(0, 10),
             radius=1.0,
         )
-        return polygon
 
     def test_setup(self):
         # Test constructor with out anything
         polygon = Polygon()
-        assert polygon.geometry == None
-        assert polygon.time_interval == None
+        assert polygon.geometry is None
+        assert polygon.time_interval is None
         assert polygon.radius == 0
         assert polygon.recurrence == Recurrence.NONE
 
-        # Test constructor with points
-        polygon = Polygon(geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]))
-        assert polygon.geometry == ShapelyPolygon([(0, 0), (1, 1), (1, 0)])
+        # Test constructor with points, the given geometry is kept as is
+        polygon = Polygon(geometry=_TRIANGLE)
+        assert polygon.geometry is _TRIANGLE
 
         # Test constructor with start and end points
         poly = Polygon(
-            geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]),
+            geometry=_TRIANGLE,
             time_interval=Interval(0, 10),
         )
-        assert poly.geometry == ShapelyPolygon([(0, 0), (1, 1), (1, 0)])
+        assert poly.geometry is _TRIANGLE
         assert poly.time_interval == Interval(0, 10)
         assert poly.radius == 0
         assert poly.recurrence == Recurrence.NONE
 
         # Test constructor with start and end points, time interval, and radius
         poly = Polygon(
-            geometry=ShapelyPolygon([(0, 0), (1, 1), (3, 3)]),
+            geometry=_COLLINEAR_00_33,
             time_interval=Interval(0, 10, closed="both"),
             radius=1.0,
         )
-        assert poly.geometry == ShapelyPolygon([(0, 0), (1, 1), (3, 3)])
+        assert poly.geometry is _COLLINEAR_00_33
         assert poly.time_interval == Interval(0, 10, closed="both")
         assert poly.radius == 1.0
         assert poly.recurrence == Recurrence.NONE
 
         # Test constructor with start and end points, time interval, radius, and recurrence
         poly = Polygon(
-            geometry=ShapelyPolygon([(0, 0), (1, 1), (3, 3)]),
+            geometry=_COLLINEAR_00_33,
             time_interval=Interval(0, 10, closed="both"),
             radius=1.0,
             recurrence=Recurrence.MINUTELY,
         )
-        assert poly.geometry == ShapelyPolygon([(0, 0), (1, 1), (3, 3)])
+        assert poly.geometry is _COLLINEAR_00_33
         assert poly.time_interval == Interval(0, 10, closed="both")
         assert poly.radius == 1.0
         assert poly.recurrence == Recurrence.MINUTELY
 
-    def test_set_geometry(self):
-        polygon = self.setup_method()
-        polygon.set_geometry([(1, 2), (2, 2), (2, 1)])
-        assert polygon.geometry == ShapelyPolygon([(1, 2), (2, 2), (2, 1)])
+    def test_buffered(self, base_polygon):
+        polygon = base_polygon.copy()
+        buffered = polygon.buffered
+        assert buffered.equals(_TRIANGLE.buffer(1.0))
 
-    def test_check_collision_with_point(self):
-        polygon = self.setup_method()
+        # the buffered geometry is cached as long as geometry and radius are unchanged
+        assert polygon.buffered is buffered
 
-        # collision check with point outside
-        point = ShapelyPoint(2, 2)
-        assert polygon.check_collision(point) == False
+        # changing the radius or geometry invalidates the cache
+        polygon.set_radius(2.0)
+        assert polygon.buffered.equals(_TRIANGLE.buffer(2.0))
 
-        # collision check with point inside
-        point = ShapelyPoint(0.5, 0.5)
-        assert polygon.check_collision(point) == True
+        polygon.set_geometry([(1, 2), (2, 2), (2, 1)])
+        assert polygon.buffered.equals(polygon.geometry.buffer(2.0))
 
-        # collision check with point inside
-        point = ShapelyPoint(0.75, 0.5)
-        assert polygon.check_collision(point) == True
+    def test_set_geometry(self, base_polygon):
+        polygon = base_polygon.copy()
+        polygon.set_geometry([(1, 2), (2, 2), (2, 1)])
+        assert list(polygon.geometry.exterior.coords) == [
+            (1, 2),
+            (2, 2),
+            (2, 1),
+            (1, 2),
+        ]
 
-        # collision check with point on the edge
-        point = ShapelyPoint(1, 1)
-        assert polygon.check_collision(point) == True
+    @pytest.mark.parametrize("other, expected", _POINT_CASES)
+    def test_check_collision_with_point(self, base_polygon, other, expected):
+        assert base_polygon.check_collision(other) == expected
 
-        # collision check with point inside radius region
-        point = ShapelyPoint(1.5, 1.5)
-        assert polygon.check_collision(point) == True
+    @pytest.mark.parametrize("line, expected", _LINE_CASES)
+    def test_check_collision_with_line_string(self, base_polygon, line, expected):
+        assert base_polygon.check_collision(line) == expected
 
-        # collision check with point slightly outside the polygon
-        point = ShapelyPoint(1.75, 1.75)
-        assert polygon.check_collision(point) == False
+    @pytest.mark.parametrize("other_polygon, expected", _POLYGON_CASES)
+    def test_check_collision_with_polygon(self, base_polygon, other_polygon, expected):
+        assert base_polygon.check_collision(other_polygon) == expected
 
-    def test_check_collision_with_line_string(self):
-        polygon = self.setup_method()
+    @pytest.fixture(scope="class")
+    @classmethod
+    def recurring_polygon(cls):
+        return Polygon(
+            geometry=_TRIANGLE,
+            time_interval=_IV_5_15,
+            radius=1.0,
+            recurrence=Recurrence.MINUTELY,
+        )
 
-        # collision check with line outside
-        line = ShapelyLine([(2, 2), (3, 3)])
-        assert polygon.check_collision(line) == False
+    @pytest.mark.parametrize("other_polygon, query, expected", _RECURRENCE_CASES)
+    def test_check_collision_with_recurring_polygon(
+        self, recurring_polygon, other_polygon, query, expected
+    ):
+        assert recurring_polygon.check_collision(other_polygon, **query) == expected
 
-        # collision check with line passing through
-        line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
-        assert polygon.check_collision(line) == True
+    def test_check_collision_batch(self, base_polygon):
+        polygon = base_polygon
 
-        # collision check with line on the edge
-        line = ShapelyLine([(0.5, 0.5), (1.5, 1.5)])
-        assert polygon.check_collision(line) == True
+        # points outside, inside, on the edge, inside the radius region and slightly outside
+        coords = get_coordinates([other for other, _ in _POINT_CASES])
+        xs, ys = coords[:, 0], coords[:, 1]
+        expected = np.array([hit for _, hit in _POINT_CASES])
 
-        # collision check with line inside radius region
-        line = ShapelyLine([(1.5, 1.5), (2.5, 2.5)])
-        assert polygon.check_collision(line) == True
+        assert np.array_equal(polygon.check_collision_batch(xs, ys), expected)
+        assert np.array_equal(
+            polygon.check_collision_batch(xs, ys, query_time=5), expected
+        )
 
-        # collision check with line slightly outside the polygon
-        line = ShapelyLine([(1.75, 1.75), (2.5, 2.5)])
-        assert polygon.check_collision(line) == False
+        # no collisions if the polygon is inactive
+        assert not polygon.check_collision_batch(xs, ys, query_time=15).any()
+        assert not polygon.check_collision_batch(
+            xs, ys, query_interval=Interval(15, 25, closed="both")
+        ).any()
 
-    def test_check_collision_with_polygon(self):
-        polygon = self.setup_method()
+        # the batched check has to agree with the scalar one
+        for other, hit in zip(points(xs, ys), polygon.check_collision_batch(xs, ys)):
+            assert polygon.check_collision(other) == hit
 
-        # collision check with polygon outside
-        other_polygon = ShapelyPolygon([(2, 2), (2, 3), (3, 3), (3, 2)])
-        assert polygon.check_collision(other_polygon) == False
+    def test_check_collision_bounding_box(self, base_polygon):
+        polygon = base_polygon.copy()
 
-        # collision check with polygon containing the polygon
-        other_polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
-        assert polygon.check_collision(other_polygon) == True
+        # the collision checks have to agree with the GEOS distance around the polygon
+        np.random.seed(0)
+        for other in points(np.random.uniform(-3, 4, (500, 2))):
+            assert polygon.check_collision(other) == (
+                polygon.geometry.distance(other) <= polygon.radius
+            )
 
-        # collision check with polygon on the edge
-        other_polygon = ShapelyPolygon([(0.5, 0.5), (0.5, 1.5), (1.5, 1.5), (1.5, 0.5)])
-        assert polygon.check_collision(other_polygon) == True
+        # points on the boundary of the radius region are in collision
+        assert polygon.check_collision(ShapelyPoint(2, 0.5))
+        assert polygon.check_collision(ShapelyPoint(0.5, -1))
 
-        # collision check with polygon inside radius region
-        other_polygon = ShapelyPolygon([(1.5, 1.5), (1.5, 2.5), (2.5, 2.5), (2.5, 1.5)])
-        assert polygon.check_collision(other_polygon) == True
+        # the collision checks follow changes of the geometry
+        polygon.set_geometry([(5, 5), (6, 6), (6, 5)])
+        assert polygon.check_collision(ShapelyPoint(6.5, 5.5))
+        assert not polygon.check_collision(_P05)
 
-        # collision check with polygon slightly outside the polygon
-        other_polygon = ShapelyPolygon(
-            [(1.75, 1.75), (1.75, 2.5), (2.5, 2.5), (2.5, 1.75)]
-        )
-        assert polygon.check_collision(other_polygon) == False
+    def test_check_collision_bounding_box_boundary(self):
+        # the point lies at a distance of exactly the radius, but the rounded difference between
+        # the point and the bounds of the polygon exceeds the radius
+        min_x, min_y = 2.440248782004602, -87.2364570003582
+        polygon = Polygon(
+            geometry=box(min_x, min_y, min_x + 5, min_y + 10.388771292943636), radius=1
+        )
+        other = ShapelyPoint(1.4402487820046017, -83.03715810452454)
+        assert min_x - other.x > polygon.radius
+        assert polygon.geometry.distance(other) <= polygon.radius
+        assert polygon.check_collision(other)
+
+        # points on the edge of the radius region around the bounding box agree with GEOS
+        np.random.seed(0)
+        xs = min_x - polygon.radius + np.random.uniform(-1e-12, 1e-12, 1000)
+        ys = np.random.uniform(min_y, min_y + 10.388771292943636, 1000)
+        for other in points(xs, ys):
+            assert polygon.check_collision(other) == (
+                polygon.geometry.distance(other) <= polygon.radius
+            )
 
-        # check collision with recurring polygon
-        poly_rec = Polygon(
-            geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]),
-            time_interval=Interval(5, 15, closed="both"),
-            radius=1.0,
-            recurrence=Recurrence.MINUTELY,
-        )
-        colliding_poly = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
-        non_colliding_poly = ShapelyPolygon([(3, 3), (3, 4), (4, 4), (4, 3)])
-
-        assert poly_rec.check_collision(colliding_poly, query_time=0) == False
-        assert poly_rec.check_collision(non_colliding_poly, query_time=0) == False
-        assert poly_rec.check_collision(colliding_poly, query_time=10) == True
-        assert poly_rec.check_collision(non_colliding_poly, query_time=10) == False
-        assert poly_rec.check_collision(colliding_poly, query_time=20) == False
-        assert poly_rec.check_collision(non_colliding_poly, query_time=20) == False
-
-        assert (
-            poly_rec.check_collision(colliding_poly, query_interval=Interval(0, 3))
-            == False
-        )
-        assert (
-            poly_rec.check_collision(non_colliding_poly, query_interval=Interval(0, 3))
-            == False
-        )
-        assert (
-            poly_rec.check_collision(colliding_poly, query_interval=Interval(3, 10))
-            == True
-        )
-        assert (
-            poly_rec.check_collision(non_colliding_poly, query_interval=Interval(3, 10))
-            == False
-        )
-        assert (
-            poly_rec.check_collision(colliding_poly, query_interval=Interval(10, 15))
-            == True
-        )
-        assert (
-            poly_rec.check_collision(
-                non_colliding_poly, query_interval=Interval(10, 15)
+        # empty points are never in collision
+        assert not polygon.check_collision(ShapelyPoint())
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def random_polygons(cls):
+        # random obstacles with an index over them, built once for all indexed collision tests
+        np.random.seed(0)
+        obstacles = [
+            Polygon.random(0, 10, 0, 10, 4, 0, 0.5, random_recurrence=True)
+            for _ in range(50)
+        ]
+        return obstacles, ObstacleIndex(obstacles)
+
+    @pytest.mark.parametrize(
+        "query", [{}, {"query_time": 50}, {"query_interval": (20, 30)}]
+    )
+    def test_check_collision_indexed(self, random_polygons, query):
+        obstacles, index = random_polygons
+
+        # the index prunes candidates, but has to find the same collisions as a linear scan
+        np.random.seed(1)
+        probes = list(points(np.random.uniform(0, 10, (50, 2))))
+        probes += [shape for shape, _ in _LINE_CASES + _POLYGON_CASES]
+        for probe in probes:
+            expected = [p for p in obstacles if p.check_collision(probe, **query)]
+            candidates = index.query(probe, **query)
+            assert [
+                p for p in candidates if p.check_collision(probe, **query)
+            ] == expected
+
+    @pytest.mark.parametrize("radius", [0, 0.5])
+    def test_check_collision_intersecting(self, radius):
+        polygon = Polygon(geometry=_TRIANGLE, radius=radius)
+
+        # intersecting and nearby shapes have to agree with the GEOS distance for all kinds of shapes
+        np.random.seed(0)
+        coords = np.random.uniform(-1, 2, (200, 2, 2))
+        shapes = list(points(coords[:, 0])) + list(linestrings(coords))
+        shapes += [shape for shape, _ in _POLYGON_CASES]
+        for shape in shapes:
+            assert polygon.check_collision(shape) == (
+                polygon.geometry.distance(shape) <= radius
             )
-            == False
-        )
 
-        assert poly_rec.check_collision(colliding_poly, query_time=120) == False
-        assert poly_rec.check_collision(non_colliding_poly, query_time=120) == False
-        assert poly_rec.check_collision(colliding_poly, query_time=130) == True
-        assert poly_rec.check_collision(non_colliding_poly, query_time=130) == False
-        assert poly_rec.check_collision(colliding_poly, query_time=140) == False
-        assert poly_rec.check_collision(non_colliding_poly, query_time=140) == False
+    def test_check_collision_vectorized(self, base_polygon):
+        polygon = base_polygon
 
-        assert (
-            poly_rec.check_collision(colliding_poly, query_interval=Interval(120, 123))
-            == False
-        )
-        assert (
-            poly_rec.check_collision(
-                non_colliding_poly, query_interval=Interval(120, 123)
-            )
-            == False
-        )
-        assert (
-            poly_rec.check_collision(colliding_poly, query_interval=Interval(125, 130))
-            == True
-        )
-        assert (
-            poly_rec.check_collision(
-                non_colliding_poly, query_interval=Interval(125, 130)
-            )
-            == False
+        # the per-shape checks of all probe shapes have to agree with a single vectorized shapely call
+        cases = _POINT_CASES + _LINE_CASES + _POLYGON_CASES
+        shapes = np.array([shape for shape, _ in cases])
+        reference = dwithin(polygon.geometry, shapes, polygon.radius)
+        np.testing.assert_array_equal(reference, [hit for _, hit in cases])
+        np.testing.assert_array_equal(
+            [polygon.check_collision(shape) for shape in shapes], reference
         )
-        assert (
-            poly_rec.check_collision(colliding_poly, query_interval=Interval(130, 140))
-            == True
-        )
-        assert (
-            poly_rec.check_collision(
-                non_colliding_poly, query_interval=Interval(130, 140)
-            )
-            == False
+
+        # the point probes have to yield the same results through the batched check
+        coords = get_coordinates(shapes[: len(_POINT_CASES)])
+        np.testing.assert_array_equal(
+            polygon.check_collision_batch(coords[:, 0], coords[:, 1]),
+            reference[: len(_POINT_CASES)],
         )
 
-    def test_check_collision_with_invalid_shape(self):
-        polygon = self.setup_method()
+    def test_check_collision_with_invalid_shape(self, base_polygon):
+        polygon = base_polygon
         with pytest.raises(TypeError):
             polygon.check_collision("invalid shape")
 
-    def test_temporal_collision_check(self):
-        in1 = Interval(0, 10, closed="both")
-        in2 = Interval(5, 15, closed="both")
-        in3 = Interval(15, 25, closed="both")
-
-        polygon = self.setup_method()
-        test_polygon = ShapelyPolygon([(0.5, 0.5), (1.5, 1.5), (2.5, 2.5)])
+        # invalid shapes are rejected even if the polygon is inactive
+        with pytest.raises(TypeError):
+            polygon.check_collision("invalid shape", query_time=15)
 
-        # collision check with polygon inside spatial area
+    def test_temporal_collision_check(self, base_polygon):
+        polygon = base_polygon.copy()
         polygon.set_interval(0, 10)
-        assert polygon.is_active(query_time=5) == True
-        assert polygon.check_collision(test_polygon, query_time=5) == True
-        assert polygon.is_active(query_interval=in1) == True
-        assert polygon.check_collision(test_polygon, query_interval=in1) == True
-        assert polygon.is_active(query_time=15) == False
-        assert polygon.check_collision(test_polygon, query_time=15) == False
-        assert polygon.is_active(query_interval=in3) == False
-        assert polygon.check_collision(test_polygon, query_interval=in3) == False
-
-        # collision check with polygon outside spatial area
-        test_polygon = ShapelyPolygon([(5.5, 5.5), (6.5, 6.5), (7.5, 7.5)])
-        assert polygon.check_collision(test_polygon, query_time=5) == False
-        assert polygon.check_collision(test_polygon, query_interval=in1) == False
-        assert polygon.check_collision(test_polygon, query_time=15) == False
-        assert polygon.check_collision(test_polygon, query_interval=in3) == False
-
-        # collision check with polygon on the edge of spatial area
-        test_polygon = ShapelyPolygon([(1, 1), (2, 2), (3, 3)])
-        assert polygon.check_collision(test_polygon, query_time=5) == True
-        assert polygon.check_collision(test_polygon, query_interval=in1) == True
-        assert polygon.check_collision(test_polygon, query_time=15) == False
-        assert polygon.check_collision(test_polygon, query_interval=in3) == False
-
-        # collision check with point and different temporal queries
-        point = ShapelyPoint(0.5, 0.5)
-        assert polygon.check_collision(point, query_time=5) == True
-        assert polygon.check_collision(point, query_interval=in1) == True
-        assert polygon.check_collision(point, query_time=15) == False
-        assert polygon.check_collision(point, query_interval=in3) == False
-
-        # collision check with line and different temporal queries
-        line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
-        assert polygon.check_collision(line, query_time=5) == True
-        assert polygon.check_collision(line, query_interval=in1) == True
-        assert polygon.check_collision(line, query_time=15) == False
-        assert polygon.check_collision(line, query_interval=in3) == False
-
-    def test_check_collision_without_time_interval(self):
-        polygon = Polygon(geometry=ShapelyPolygon([(0, 0), (1, 1), (2, 2)]), radius=1.0)
-
-        # collision check with point outside
-        point = ShapelyPoint(3, 3)
-        assert polygon.check_collision(point) == False
-
-        # collision check with point inside
-        point = ShapelyPoint(0.5, 0.5)
-        assert polygon.check_collision(point) == True
-
-        # collision check with point inside at arbitrary time
-        point = ShapelyPoint(0.5, 0.5)
-        assert polygon.check_collision(point, query_time=5) == True
-
-        # collision check with point outside at arbitrary time
-        point = ShapelyPoint(3, 3)
-        assert polygon.check_collision(point, query_time=5) == False
-
-        # collision check with line inside
-        line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
-        assert polygon.check_collision(line) == True
-
-        # collision check with line outside
-        line = ShapelyLine([(4, 4), (3, 3)])
-        assert polygon.check_collision(line) == False
-
-        # collision check with line inside at arbitrary time
-        line = ShapelyLine([(0, 0), (1, 1), (2, 2)])
-        assert polygon.check_collision(line, query_time=5) == True
-
-        # collision check with line outside at arbitrary time
-        line = ShapelyLine([(4, 4), (3, 3)])
-        assert polygon.check_collision(line, query_time=5) == False
-
-        # collision check with polygon inside
-        other_polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
-        assert polygon.check_collision(other_polygon) == True
-
-        # collision check with polygon outside
-        other_polygon = ShapelyPolygon([(4, 4), (4, 3), (3, 3), (3, 4)])
-        assert polygon.check_collision(other_polygon) == False
 
-        # collision check with polygon inside at arbitrary time
-        other_polygon = ShapelyPolygon([(0, 0), (0, 1), (1, 1), (1, 0)])
-        assert polygon.check_collision(other_polygon, query_time=5) == True
-
-        # collision check with polygon touching at arbitrary time
-        other_polygon = ShapelyPolygon([(3, 3), (2, 3), (3, 3), (3, 2)])
-        assert polygon.check_collision(other_polygon, query_time=5) == True
-
-        # collision check with polygon outside at arbitrary time
-        other_polygon = ShapelyPolygon([(3, 3), (4, 3), (3, 3), (3, 5)])
-        assert polygon.check_collision(other_polygon, query_time=5) == False
+        # plain tuples are accepted as closed query intervals
+        assert polygon.is_active(query_time=5)
+        assert polygon.is_active(query_interval=(0, 10))
+        assert not polygon.is_active(query_time=15)
+        assert not polygon.is_active(query_interval=(15, 25))
+
+        # shapes inside, outside and on the edge of the spatial area, which collide only while active
+        shapes = [
+            _COLLINEAR_05_25,
+            _COLLINEAR_55_75,
+            _COLLINEAR_11_33,
+            _P05,
+            _LINE_00_22,
+        ]
+        in_area = np.array([True, False, True, True, True])
 
-    def test_plot(self):
-        fig = plt.figure()
+        for query, active in [
+            ({"query_time": 5}, True),
+            ({"query_interval": (0, 10)}, True),
+            ({"query_time": 15}, False),
+            ({"query_interval": (15, 25)}, False),
+        ]:
+            results = [polygon.check_collision(shape, **query) for shape in shapes]
+            np.testing.assert_array_equal(results, in_area & active)
 
-        # Test case 1: No figure provided
-        polygon = Polygon(geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]))
-        polygon.plot()  # Plot the polygon on a new figure
+    def test_check_collision_without_time_interval(self):
+        polygon = Polygon(geometry=_COLLINEAR_00_22, radius=1.0)
+
+        # shapes inside, outside and touching the spatial area, independent of the query time
+        shapes = [
+            _P05,
+            _P33,
+            _LINE_00_22,
+            _LINE_44_33,
+            _SQUARE_00_11,
+            _SQUARE_33_44,
+            _TOUCHING_33,
+            _OUTSIDE_33,
+        ]
+        expected = [True, False, True, False, True, False, True, False]
 
-        # Test case 2: Plotting on an existing figure
-        polygon = Polygon(geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]))
-        polygon.plot(fig=fig)  # Plot the polygon on the provided figure
+        for query_time in [None, 5]:
+            results = [polygon.check_collision(shape, query_time) for shape in shapes]
+            np.testing.assert_array_equal(results, expected)
 
-        # Test case 3: Plotting with temporal input arguments
-        polygon = Polygon(geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]), radius=1.0)
-        polygon.plot(
-            fig=fig, query_time=5
-        )  # Plot the polygon at a specific time on the provided figure
+    @pytest.mark.plot
+    @pytest.mark.parametrize("radius, query, on_figure", _PLOT_CASES)
+    def test_plot(self, fig, radius, query, on_figure):
+        polygon = Polygon(geometry=_TRIANGLE, radius=radius)
+        fig.clear()
 
-        # Test case 4: Plotting with temporal input arguments
-        polygon = Polygon(geometry=ShapelyPolygon([(0, 0), (1, 1), (1, 0)]), radius=1.0)
-        polygon.plot(fig=fig, query_interval=Interval(0, 10))
+        if on_figure:
+            polygon.plot(fig=fig, **query)
+        else:
+            polygon.plot(**query)
 
-    def test_load_save(self):
+    def test_load_save(self, tmp_path):
         radius = 5.5
-        polygon = ShapelyPolygon([(0, 0), (1, 1), (1, 0)])
+        polygon = _TRIANGLE
         time_interval = Interval(0, 10, closed="left")
 
         # Test case 1: Convert polygon object to JSON and back (only geometry)
         poly_1 = Polygon(geometry=polygon)
         json_1 = poly_1.export_to_json()
         loaded_1 = Polygon(json_data=json_1)
-        assert loaded_1.geometry == polygon
+        assert loaded_1.geometry.wkb == polygon.wkb
         assert loaded_1.time_interval == None
         assert loaded_1.radius == 0
 
@@ -374,7 +431,7 @@ class TestPolygon:
         poly_2 = Polygon(geometry=polygon, time_interval=time_interval)
         json_2 = poly_2.export_to_json()
         loaded_2 = Polygon(json_data=json_2)
-        assert loaded_2.geometry == polygon
+        assert loaded_2.geometry.wkb == polygon.wkb
         assert loaded_2.time_interval == time_interval
         assert loaded_2.radius == 0
 
@@ -382,7 +439,7 @@ class TestPolygon:
         poly_3 = Polygon(geometry=polygon, time_interval=time_interval, radius=radius)
         json_3 = poly_3.export_to_json()
         loaded_3 = Polygon(json_data=json_3)
-        assert loaded_3.geometry == polygon
+        assert loaded_3.geometry.wkb == polygon.wkb
         assert loaded_3.time_interval == time_interval
         assert loaded_3.radius == radius
 
@@ -390,7 +447,7 @@ class TestPolygon:
         poly_4 = Polygon(time_interval=time_interval, radius=radius)
         json_4 = poly_4.export_to_json()
         loaded_4 = Polygon(json_data=json_4)
-        assert loaded_4.geometry == None
+        assert loaded_4.geometry is None
         assert loaded_4.time_interval == time_interval
         assert loaded_4.radius == radius
 
@@ -398,7 +455,7 @@ class TestPolygon:
         poly_5 = Polygon(geometry=polygon, radius=radius)
         json_5 = poly_5.export_to_json()
         loaded_5 = Polygon(json_data=json_5)
-        assert loaded_5.geometry == polygon
+        assert loaded_5.geometry.wkb == polygon.wkb
         assert loaded_5.time_interval == None
         assert loaded_5.radius == radius
 
@@ -406,7 +463,7 @@ class TestPolygon:
         poly_6 = Polygon(radius=radius)
         json_6 = poly_6.export_to_json()
         loaded_6 = Polygon(json_data=json_6)
-        assert loaded_6.geometry == None
+        assert loaded_6.geometry is None
         assert loaded_6.time_interval == None
         assert loaded_6.radius == radius
 
@@ -414,7 +471,7 @@ class TestPolygon:
         poly_7 = Polygon(geometry=polygon, time_interval=time_interval)
         json_7 = poly_7.export_to_json()
         loaded_7 = Polygon(json_data=json_7)
-        assert loaded_7.geometry == polygon
+        assert loaded_7.geometry.wkb == polygon.wkb
         assert loaded_7.time_interval == time_interval
         assert loaded_7.radius == 0
 
@@ -427,7 +484,7 @@ class TestPolygon:
         )
         json_8 = poly_8.export_to_json()
         loaded_8 = Polygon(json_data=json_8)
-        assert loaded_8.geometry == polygon
+        assert loaded_8.geometry.wkb == polygon.wkb
         assert loaded_8.time_interval == time_interval
         assert loaded_8.radius == radius
         assert loaded_8.recurrence == Recurrence.MINUTELY
@@ -441,29 +498,120 @@ class TestPolygon:
         )
         json_8 = poly_8.export_to_json()
 
-        with open("test_polygon_saving.txt", "w") as f:
-            json.dump(json_8, f)
-
-        with open("test_polygon_saving.txt", "r") as f:
-            json_obj8_loaded = json.load(f)
+        path = tmp_path / "test_polygon_saving.json"
+        path.write_bytes(json.dumps(json_8).encode())
+        json_obj8_loaded = json.loads(path.read_bytes())
 
         loaded_8 = Polygon(json_data=json_obj8_loaded)
-        assert loaded_8.geometry == polygon
+        assert loaded_8.geometry.wkb == polygon.wkb
         assert loaded_8.time_interval == time_interval
         assert loaded_8.radius == radius
         assert loaded_8.recurrence == Recurrence.HOURLY
 
-        os.remove("test_polygon_saving.txt")
-
-    def test_copy(self):
-        polygon = self.setup_method()
+    def test_load_stringified_geometry(self):
+        # Load polygon object from JSON with the stringified geometry
+        json_data = {
+            "radius": "5.5",
+            "interval": str(Interval(0, 10, closed="left")),
+            "recurrence": Recurrence.NONE.to_string(),
+            "geometry": _TRIANGLE.wkt,
+        }
+        loaded = Polygon(json_data=json_data)
+        assert loaded.geometry.wkb == _TRIANGLE.wkb
+        assert loaded.time_interval == Interval(0, 10, closed="left")
+        assert loaded.radius == 5.5
+
+        # Load polygon object from JSON without a stringified geometry
+        loaded = Polygon(json_data={**json_data, "geometry": "None"})
+        assert loaded.geometry is None
+
+    def test_copy(self, base_polygon):
+        polygon = base_polygon
         polygon_copy = polygon.copy()
 
-        assert polygon_copy.geometry == polygon.geometry
+        assert polygon_copy.geometry is polygon.geometry
         assert polygon_copy.time_interval == polygon.time_interval
         assert polygon_copy.radius == polygon.radius
         assert polygon_copy.recurrence == polygon.recurrence
 
+        # the copy shares the buffer cache until its radius changes
+        buffered = polygon.buffered
+        polygon_copy = polygon.copy()
+        assert polygon_copy.buffered is buffered
+        polygon_copy.set_radius(2.0)
+        assert polygon_copy.buffered.equals(_TRIANGLE.buffer(2.0))
+        assert polygon.buffered is buffered
+
+        # changes to the copy do not affect the original polygon
+        polygon_copy.set_interval(20, 30)
+        polygon_copy.set_geometry([(5, 5), (6, 6), (6, 5)])
+        assert polygon.time_interval == Interval(0, 10)
+        assert polygon.geometry is _TRIANGLE
+        assert polygon.check_collision(_P05, query_time=5)
+        assert not polygon_copy.check_collision(_P05, query_time=25)
+        assert polygon_copy.check_collision(ShapelyPoint(5.5, 5.2), query_time=25)
+
+    @pytest.mark.parametrize(
+        "options",
+        [
+            {},
+            {"only_static": True},
+            {"only_dynamic": True, "random_recurrence": True},
+            {
+                "min_points": 4,
+                "max_points": 10,
+                "min_interval": 100,
+                "max_interval": 200,
+            },
+        ],
+    )
+    def test_random_batch(self, options):
+        min_x, max_x, min_y, max_y = -50, 50, 0, 100
+        max_size, min_radius, max_radius = 8, 0.5, 2
+        min_interval = options.get("min_interval", 0)
+        max_interval = options.get("max_interval", 100)
+        max_points = options.get("max_points", 7)
+
+        generated = Polygon.random_batch(
+            50, min_x, max_x, min_y, max_y, max_size, min_radius, max_radius, **options
+        )
+        assert len(generated) == 50
+
+        # all generated are convex hulls within the bounds and of the maximum size
+        size_sqrt = np.sqrt(max_size / 2)
+        for polygon in generated:
+            assert isinstance(polygon.geometry, ShapelyPolygon)
+            assert polygon.geometry.convex_hull.equals(polygon.geometry)
+            assert len(polygon.geometry.exterior.coords) <= max_points
+
+            coords = get_coordinates(polygon.geometry)
+            assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+            assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
+            assert np.ptp(coords[:, 0]) <= 2 * size_sqrt
+            assert np.ptp(coords[:, 1]) <= 2 * size_sqrt
+
+        radii = np.array([polygon.radius for polygon in generated])
+        assert np.all((radii >= min_radius) & (radii <= max_radius))
+
+        # static generated have neither a time interval nor a recurrence
+        static = [p for p in generated if p.time_interval is None]
+        assert all(p.recurrence == Recurrence.NONE for p in static)
+        if options.get("only_static"):
+            assert len(static) == len(generated)
+        if options.get("only_dynamic"):
+            assert len(static) == 0
+
+        dynamic = [p for p in generated if p.time_interval is not None]
+        lefts = np.array([p.time_interval.left for p in dynamic])
+        rights = np.array([p.time_interval.right for p in dynamic])
+        assert np.all((lefts >= min_interval) & (rights <= max_interval))
+        assert np.all(lefts <= rights)
+
+        if options.get("random_recurrence"):
+            assert all(p.recurrence in _VALID_RECURRENCES for p in dynamic)
+        else:
+            assert all(p.recurrence == Recurrence.NONE for p in dynamic)
+
     def test_random(self):
         ## Test random polygon generation with different inputs.
         ## For each combination of inputs, multiple polygons are generated and tested for correct parameters.
@@ -491,10 +639,9 @@ class TestPolygon:
             max_size=max_size,
         )
 
-        coords = poly1.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly1.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly1.time_interval == None or (
             poly1.time_interval.left >= min_interval_default
@@ -520,10 +667,9 @@ class TestPolygon:
             max_size=max_size,
         )
 
-        coords = poly2.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly2.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly2.time_interval == None or (
             poly2.time_interval.left >= min_interval_default
@@ -544,10 +690,9 @@ class TestPolygon:
             only_static=True,
         )
 
-        coords = poly3.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly3.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly3.time_interval == None
         assert poly3.radius >= min_radius and poly3.radius <= max_radius
@@ -571,10 +716,9 @@ class TestPolygon:
             only_static=True,
         )
 
-        coords = poly4.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly4.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly4.time_interval == None
         assert poly4.radius >= min_radius and poly4.radius <= max_radius
@@ -600,20 +744,14 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly5.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly5.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly5.time_interval.left >= min_interval_default
         assert poly5.time_interval.right <= max_interval_default
         assert poly5.radius >= min_radius and poly5.radius <= max_radius
-        assert poly5.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert poly5.recurrence in _VALID_RECURRENCES
 
         poly6 = Polygon.random(
             min_x=min_x,
@@ -627,20 +765,14 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly6.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly6.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly6.time_interval.left >= min_interval_default
         assert poly6.time_interval.right <= max_interval_default
         assert poly6.radius >= min_radius and poly6.radius <= max_radius
-        assert poly6.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert poly6.recurrence in _VALID_RECURRENCES
 
         poly7 = Polygon.random(
             min_x=min_x,
@@ -654,20 +786,14 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly7.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly7.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly7.time_interval.left >= min_interval_default
         assert poly7.time_interval.right <= max_interval_default
         assert poly7.radius >= min_radius and poly7.radius <= max_radius
-        assert poly7.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert poly7.recurrence in _VALID_RECURRENCES
 
         # Test case 4 - dynamic polygons with custom time interval
         min_interval = 100
@@ -687,20 +813,14 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly8.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly8.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly8.time_interval.left >= min_interval
         assert poly8.time_interval.right <= max_interval
         assert poly8.radius >= min_radius and poly8.radius <= max_radius
-        assert poly8.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert poly8.recurrence in _VALID_RECURRENCES
 
         poly9 = Polygon.random(
             min_x=min_x,
@@ -716,20 +836,14 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly9.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly9.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly9.time_interval.left >= min_interval
         assert poly9.time_interval.right <= max_interval
         assert poly9.radius >= min_radius and poly9.radius <= max_radius
-        assert poly9.recurrence in [
-            Recurrence.NONE,
-            Recurrence.MINUTELY,
-            Recurrence.HOURLY,
-            Recurrence.DAILY,
-        ]
+        assert poly9.recurrence in _VALID_RECURRENCES
 
         poly10 = Polygon.random(
             min_x=min_x,
@@ -744,10 +858,9 @@ class TestPolygon:
             only_dynamic=True,
         )
 
-        coords = poly10.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly10.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly10.time_interval.left >= min_interval
         assert poly10.time_interval.right <= max_interval
@@ -778,10 +891,9 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly11.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly11.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly11.radius >= min_radius and poly11.radius <= max_radius
 
@@ -791,12 +903,7 @@ class TestPolygon:
         else:
             assert poly11.time_interval.left >= min_interval
             assert poly11.time_interval.right <= max_interval
-            assert poly11.recurrence in [
-                Recurrence.NONE,
-                Recurrence.MINUTELY,
-                Recurrence.HOURLY,
-                Recurrence.DAILY,
-            ]
+            assert poly11.recurrence in _VALID_RECURRENCES
 
         poly12 = Polygon.random(
             min_x=min_x,
@@ -811,10 +918,9 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly12.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly12.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly12.radius >= min_radius and poly12.radius <= max_radius
 
@@ -824,12 +930,7 @@ class TestPolygon:
         else:
             assert poly12.time_interval.left >= min_interval
             assert poly12.time_interval.right <= max_interval
-            assert poly12.recurrence in [
-                Recurrence.NONE,
-                Recurrence.MINUTELY,
-                Recurrence.HOURLY,
-                Recurrence.DAILY,
-            ]
+            assert poly12.recurrence in _VALID_RECURRENCES
 
         poly13 = Polygon.random(
             min_x=min_x,
@@ -844,10 +945,9 @@ class TestPolygon:
             random_recurrence=True,
         )
 
-        coords = poly13.geometry.exterior.coords
-        for coord in coords:
-            assert coord[0] >= min_x and coord[0] <= max_x
-            assert coord[1] >= min_y and coord[1] <= max_y
+        coords = get_coordinates(poly13.geometry)
+        assert np.all((coords[:, 0] >= min_x) & (coords[:, 0] <= max_x))
+        assert np.all((coords[:, 1] >= min_y) & (coords[:, 1] <= max_y))
 
         assert poly13.radius >= min_radius and poly13.radius <= max_radius
 
@@ -857,9 +957,4 @@ class TestPolygon:
         else:
             assert poly13.time_interval.left >= min_interval
             assert poly13.time_interval.right <= max_interval
-            assert poly13.recurrence in [
-                Recurrence.NONE,
-                Recurrence.MINUTELY,
-                Recurrence.HOURLY,
-                Recurrence.DAILY,
-            ]
+            assert poly13.recurrence in _VALID_RECURRENCES
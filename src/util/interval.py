@@ -0,0 +1,96 @@
+from typing import NamedTuple
+
+
+class Interval(NamedTuple):
+    """
+    Lightweight numeric interval used for internal temporal bookkeeping. It mirrors the semantics of
+    the pandas `Interval`, but is a plain tuple, which is cheap to construct, compare and hash.
+
+    Attributes:
+        left (float): The lower bound of the interval.
+        right (float): The upper bound of the interval.
+        closed_left (bool): Whether the interval is closed on the left side.
+        closed_right (bool): Whether the interval is closed on the right side.
+
+    Methods:
+        from_pandas(interval: pandas.Interval): Creates an interval from a pandas interval.
+        contains(value: float): Checks if a value lies within the interval.
+        overlaps(other): Checks if the interval overlaps with another interval.
+        shift(offset: float): Returns the interval shifted by a given offset.
+    """
+
+    left: float
+    right: float
+    closed_left: bool = True
+    closed_right: bool = True
+
+    @classmethod
+    def from_pandas(cls, interval):
+        """
+        Creates an interval from a pandas interval.
+
+        Args:
+            interval (pandas.Interval): The pandas interval to convert, may be None.
+
+        Returns:
+            Interval: The converted interval, or None if no interval was given.
+        """
+        if interval is None:
+            return None
+
+        return cls(
+            interval.left, interval.right, interval.closed_left, interval.closed_right
+        )
+
+    def contains(self, value: float):
+        """
+        Checks if a value lies within the interval. Equivalent to `value in pandas.Interval(...)`.
+
+        Args:
+            value (float): The value to check.
+
+        Returns:
+            bool: True if the value lies within the interval, False otherwise.
+        """
+        if value < self.left or (value == self.left and not self.closed_left):
+            return False
+        if value > self.right or (value == self.right and not self.closed_right):
+            return False
+        return True
+
+    def overlaps(self, other):
+        """
+        Checks if the interval overlaps with another interval. Equivalent to `pandas.Interval.overlaps`,
+        i.e., intervals which only share an open endpoint are not considered to be overlapping.
+        The other interval can be any object with `left`, `right`, `closed_left` and `closed_right`
+        attributes, including pandas intervals.
+
+        Args:
+            other: The interval to check for overlap.
+
+        Returns:
+            bool: True if the intervals overlap, False otherwise.
+        """
+        if self.closed_left and other.closed_right:
+            if not self.left <= other.right:
+                return False
+        elif not self.left < other.right:
+            return False
+
+        if other.closed_left and self.closed_right:
+            return other.left <= self.right
+        return other.left < self.right
+
+    def shift(self, offset: float):
+        """
+        Returns the interval shifted by a given offset.
+
+        Args:
+            offset (float): The offset to shift the interval by.
+
+        Returns:
+            Interval: The shifted interval.
+        """
+        return Interval(
+            self.left + offset, self.right + offset, self.closed_left, self.closed_right
+        )